@@ -1,45 +1,86 @@
 """
 Quick script to check if models are downloaded and cached
 """
+import functools
 import time
 from services.model_loader import ModelLoader
 from pathlib import Path
 import os
 
-def check_cache_size():
-    """Check the size of the Hugging Face cache"""
-    # Check multiple possible cache locations
+def _scan_dir(directory) -> tuple:
+    """
+    Recursively sum file sizes using os.scandir
+
+    DirEntry.stat() reuses the info the OS already returned while listing
+    the directory (cached on Windows), so this avoids the extra stat
+    syscall per file that os.walk + Path.stat() would incur.
+    """
+    total_size = 0
+    file_count = 0
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        sub_size, sub_count = _scan_dir(entry.path)
+                        total_size += sub_size
+                        file_count += sub_count
+                    else:
+                        total_size += entry.stat().st_size
+                        file_count += 1
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return total_size, file_count
+
+
+@functools.lru_cache(maxsize=1)
+def _hf_cache_root():
+    """
+    Resolve the Hugging Face cache directory once and memoize it
+
+    Honors the standard HF environment variables first, then probes the
+    usual default locations. Uses os.path.isdir (a single C-level stat)
+    instead of Path.exists so repeated calls cost nothing.
+    """
+    # Environment variables take precedence over default locations
+    for env_var in ('HF_HOME', 'TRANSFORMERS_CACHE', 'HUGGINGFACE_HUB_CACHE'):
+        value = os.getenv(env_var)
+        if value and os.path.isdir(value):
+            return Path(value)
+
+    home = str(Path.home())
     possible_dirs = [
-        Path.home() / '.cache' / 'huggingface',
-        Path.home() / '.cache' / 'huggingface' / 'transformers',
-        Path.home() / '.cache' / 'huggingface' / 'hub',
+        os.path.join(home, '.cache', 'huggingface'),
+        os.path.join(home, '.cache', 'huggingface', 'transformers'),
+        os.path.join(home, '.cache', 'huggingface', 'hub'),
     ]
-    
+
     # Also check Windows AppData location
     appdata = os.getenv('APPDATA', '')
     if appdata:
         possible_dirs.extend([
-            Path(appdata) / '.cache' / 'huggingface',
-            Path(appdata) / '.cache' / 'huggingface' / 'transformers',
+            os.path.join(appdata, '.cache', 'huggingface'),
+            os.path.join(appdata, '.cache', 'huggingface', 'transformers'),
         ])
-    
+
+    for cache_dir in possible_dirs:
+        if os.path.isdir(cache_dir):
+            return Path(cache_dir)
+
+    return None
+
+
+def check_cache_size():
+    """Check the size of the Hugging Face cache"""
     total_size = 0
     file_count = 0
-    found_dir = None
-    
-    for cache_dir in possible_dirs:
-        if cache_dir.exists():
-            found_dir = cache_dir
-            for root, dirs, files in os.walk(cache_dir):
-                for file in files:
-                    file_path = Path(root) / file
-                    try:
-                        total_size += file_path.stat().st_size
-                        file_count += 1
-                    except:
-                        pass
-            break
-    
+    found_dir = _hf_cache_root()
+
+    if found_dir:
+        total_size, file_count = _scan_dir(found_dir)
+
     size_mb = total_size / (1024 * 1024)
     if found_dir:
         return size_mb, f"{file_count} files in {found_dir}"
@@ -72,10 +113,12 @@ def main():
     
     # Test T5-Small
     print("Loading T5-Small...")
-    start = time.time()
+    # perf_counter: monotonic, high-resolution (time.time has ~15ms
+    # granularity on Windows and can jump with wall-clock adjustments)
+    start = time.perf_counter()
     try:
         t5_model, t5_tokenizer = loader.load_t5_model()
-        t5_time = time.time() - start
+        t5_time = time.perf_counter() - start
         print(f"  [OK] Loaded in {t5_time:.2f} seconds")
         if t5_time < 5:
             print(f"  [OK] CACHED (would take ~5 min if downloading)")
@@ -87,10 +130,10 @@ def main():
     
     # Test DistilBERT
     print("\nLoading DistilBERT...")
-    start = time.time()
+    start = time.perf_counter()
     try:
         distil_model, distil_tokenizer = loader.load_distilbert_model()
-        distil_time = time.time() - start
+        distil_time = time.perf_counter() - start
         print(f"  [OK] Loaded in {distil_time:.2f} seconds")
         if distil_time < 5:
             print(f"  [OK] CACHED (would take ~5 min if downloading)")
@@ -17,7 +17,9 @@ TEMP_UPLOADS_DIR.mkdir(exist_ok=True)
 
 # File upload settings
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-ALLOWED_EXTENSIONS = {".pdf", ".docx"}
+# frozenset: O(1) membership on the per-request validation path, and
+# immutable so it can't be mutated by accident at runtime
+ALLOWED_EXTENSIONS = frozenset({".pdf", ".docx"})
 
 # AI Model settings
 # Model 1: T5-Small for text summarization
@@ -26,7 +28,34 @@ T5_MODEL_NAME = os.getenv("T5_MODEL_NAME", "t5-small")
 DISTILBERT_MODEL_NAME = os.getenv("DISTILBERT_MODEL_NAME", "distilbert-base-uncased")
 # Legacy support
 MODEL_NAME = os.getenv("MODEL_NAME", DISTILBERT_MODEL_NAME)
+# Document classification runs on keyword scoring, so DistilBERT is not
+# loaded by default — it costs ~270MB RSS and minutes of cold-start
+# download for a model no live code path queries. Set to "1" to prewarm
+# it anyway (e.g. when experimenting with model-based classification)
+USE_DISTILBERT = os.getenv("USE_DISTILBERT", "0") == "1"
 DEVICE = os.getenv("DEVICE", "cpu")  # 'cpu' or 'cuda'
+# Dynamic INT8 quantization of model linear layers on CPU
+# (2-4x faster matmuls with negligible quality loss; set to "0" to disable)
+QUANTIZE_INT8 = os.getenv("QUANTIZE_INT8", "1") == "1" and DEVICE == "cpu"
+# Compile the T5 model with torch.compile to fuse the generate hot loop
+# (10-30% less per-step dispatch overhead). Opt-in because the first
+# compile adds a 10-20s one-time stall, paid during startup warmup
+TORCH_COMPILE = os.getenv("TORCH_COMPILE", "0") == "1"
+# Run T5 inference in BF16 via Intel Extension for PyTorch (requires
+# intel_extension_for_pytorch and an AVX-512 BF16 / AMX capable CPU).
+# Opt-in; mutually exclusive with INT8 quantization on the PyTorch path
+USE_BF16 = os.getenv("USE_BF16", "0") == "1" and DEVICE == "cpu"
+# Run T5 summarization through ONNX Runtime (requires optimum[onnxruntime]).
+# ORT fuses attention/LayerNorm/GELU kernels and is typically 1.2-2x faster
+# than eager PyTorch on CPU; opt-in since it adds a heavyweight dependency
+USE_ONNX = os.getenv("USE_ONNX", "0") == "1"
+# Where the exported ONNX graphs are cached so the export cost is paid once
+ONNX_MODEL_DIR = BASE_DIR / "onnx_models"
+# Beam width for T5 summary generation. Decode cost is linear in beam
+# width; 2 beams cost half the decoder FLOPs of the previous 4-beam
+# search with little quality difference on short brief summaries.
+# Set to 1 for pure greedy decoding (fastest)
+SUMMARY_NUM_BEAMS = int(os.getenv("SUMMARY_NUM_BEAMS", "2"))
 
 # Model cache directory (Hugging Face transformers will cache here by default)
 # Default location: ~/.cache/huggingface/transformers
@@ -36,3 +65,13 @@ DEVICE = os.getenv("DEVICE", "cpu")  # 'cpu' or 'cuda'
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
 API_PORT = int(os.getenv("API_PORT", "8000"))
 
+# Maximum number of CPU-bound parse/inference jobs allowed to run at once
+# Bounding this keeps a burst of uploads from oversubscribing the CPU
+MAX_CONCURRENT_INFER = int(os.getenv("MAX_CONCURRENT_INFER", str(os.cpu_count() or 2)))
+
+# Number of dedicated summarization worker processes. 0 (the default)
+# runs T5 in-process; a positive value starts a warm ProcessPoolExecutor
+# whose workers each load the model once and reuse it, letting concurrent
+# summarizations run on separate cores instead of sharing one interpreter
+SUMMARY_WORKERS = int(os.getenv("SUMMARY_WORKERS", "0"))
+
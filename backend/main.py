@@ -1,25 +1,39 @@
 """
 FastAPI server entry point for Document Insight Extractor
 """
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, Request, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+import asyncio
+import hashlib
 import logging
+import re
+import tempfile
 
 from services.document_parser import parse_document, DocumentParseError
-from services.ai_extractor import AIExtractor
-from utils.helpers import validate_file_extension, generate_unique_filename, cleanup_temp_file, get_file_size
-from config import TEMP_UPLOADS_DIR, MAX_FILE_SIZE
+from services.ai_extractor import (
+    AIExtractor, get_summary_pool, shutdown_summary_pool,
+    start_summary_batcher, stop_summary_batcher
+)
+from services.model_loader import prefetch_model_weights
+from utils.helpers import get_file_suffix
+from config import ALLOWED_EXTENSIONS, MAX_FILE_SIZE, MAX_CONCURRENT_INFER, USE_DISTILBERT
 
-# Configure logging
+# Configure logging once for the whole application; service modules just
+# call logging.getLogger(__name__) and inherit this configuration
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="AI-Powered Document Insight Extractor",
     description="Extract structured insights from retail media documents",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes large text payloads several times faster than
+    # the stdlib json encoder used by the default JSONResponse
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -39,6 +53,233 @@ app.add_middleware(
 )
 
 
+@lru_cache(maxsize=1)
+def get_extractor() -> AIExtractor:
+    """
+    Return the shared AIExtractor instance
+
+    A single instance keeps tokenizers, model handles and compiled regex
+    patterns alive across requests instead of rebuilding them per call.
+    """
+    return AIExtractor()
+
+
+# Warmup input for the dummy inference. It must clear summarize_text's
+# extractive short-circuit (>= 300 characters and more than three
+# sentences), otherwise the call returns before ever touching T5 and the
+# first real request still pays the cold-start cost
+_WARMUP_TEXT = (
+    "This campaign brief covers the summer promotion across all retail media "
+    "channels for the upcoming season. The primary goal is to drive awareness "
+    "and increase add-to-basket rates for the featured product range. "
+    "Creative assets must follow the brand guidelines and be delivered two "
+    "weeks before the campaign launch date. Performance will be measured "
+    "against click-through rate and conversion targets agreed with the media "
+    "team during planning."
+)
+
+
+def _warm_up_extractor() -> AIExtractor:
+    """
+    Build the AIExtractor, load the models and run a dummy inference
+
+    Loading T5 (and DistilBERT, when enabled) and running one short
+    summarization warms the tokenizers and PyTorch kernels so the first
+    real request doesn't pay the multi-second cold-start cost.
+    """
+    extractor = get_extractor()
+    try:
+        # Hint the OS to prefetch cached weights before the load calls
+        prefetch_model_weights()
+        extractor.model_loader.load_t5_model()
+        # Classification is keyword-based; DistilBERT stays unloaded
+        # unless explicitly requested, saving ~270MB RSS per worker
+        if USE_DISTILBERT:
+            extractor.model_loader.load_distilbert_model()
+        extractor.summarize_text(_WARMUP_TEXT, max_length=20, min_length=5)
+        logger.info("Model warmup completed")
+    except Exception as e:
+        # Models will still load lazily on first request if warmup fails
+        logger.warning("Model warmup failed (will load lazily): %s", str(e))
+    return extractor
+
+
+# Readiness flag: stays False until model warmup has completed so
+# orchestrators don't route traffic to a cold instance
+app.state.ready = False
+
+
+@app.on_event("startup")
+async def prewarm_models():
+    """Load and warm the AI models before serving traffic"""
+    logger.info("Prewarming AI models...")
+    # Run in a thread so startup doesn't block the event loop
+    app.state.extractor = await asyncio.to_thread(_warm_up_extractor)
+    # Start the warm summarization workers (no-op unless configured)
+    get_summary_pool()
+    # Start the micro-batcher that groups concurrent summarizations
+    start_summary_batcher(app.state.extractor)
+    app.state.ready = True
+
+
+@app.on_event("shutdown")
+async def shutdown_workers():
+    """Shut down the summarization batcher and worker pool cleanly"""
+    await stop_summary_batcher()
+    shutdown_summary_pool()
+
+
+# Read uploads in 64 KB chunks so peak memory stays flat per request
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Matches one word at a time so counting never materializes a list of
+# every token the way len(text.split()) does
+_WORD_RE = re.compile(r'\S+')
+
+
+def _word_count(text: str) -> int:
+    """Count whitespace-separated words with a streaming scan"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+# Bound concurrent CPU-bound work so the event loop stays responsive and
+# the torch threadpool isn't oversubscribed by a burst of uploads
+INFER_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_INFER)
+
+# LRU cache of extraction results keyed by upload content hash, so
+# re-submitted documents skip model inference entirely
+_INSIGHT_CACHE: "OrderedDict[str, dict]" = OrderedDict()
+_INSIGHT_CACHE_MAX = 128
+
+
+async def _spool_upload(file: UploadFile):
+    """
+    Stream an uploaded file into an in-memory spooled buffer
+
+    Reads the upload in 64 KB chunks into a SpooledTemporaryFile, aborting
+    as soon as the running total exceeds MAX_FILE_SIZE. Accepted uploads
+    (<= MAX_FILE_SIZE) stay entirely in memory, so parsers read straight
+    from the buffer without a temp-file round-trip.
+
+    Args:
+        file: Uploaded file
+
+    Returns:
+        Tuple of (buffer rewound to the start, total size in bytes,
+        BLAKE2b hex digest of the content)
+
+    Raises:
+        HTTPException: If the upload exceeds MAX_FILE_SIZE
+    """
+    buffer = tempfile.SpooledTemporaryFile(max_size=MAX_FILE_SIZE)
+    hasher = hashlib.blake2b(digest_size=16)
+    total = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > MAX_FILE_SIZE:
+            buffer.close()
+            raise HTTPException(
+                status_code=400,
+                detail=f"File size exceeds maximum allowed size of {MAX_FILE_SIZE / (1024*1024):.1f}MB"
+            )
+        hasher.update(chunk)
+        buffer.write(chunk)
+    buffer.seek(0)
+    return buffer, total, hasher.hexdigest()
+
+
+async def _ingest_document(request: Request, file: UploadFile):
+    """
+    Shared validate/read/parse pipeline for all upload endpoints
+
+    Runs the full ingestion sequence once: validates the filename and
+    extension, streams the upload into memory, rejects empty bodies and
+    parses the document text. All three upload endpoints share this, so
+    hot-path optimizations only need to be applied in one place.
+
+    Args:
+        request: Incoming request (used for the Content-Length pre-check)
+        file: Uploaded file (PDF or DOCX)
+
+    Returns:
+        Tuple of (extracted text, file size in bytes, content hash,
+        lowercased file suffix like ".pdf")
+
+    Raises:
+        HTTPException: If validation, reading or parsing fails
+    """
+    # Reject oversize uploads from the Content-Length header before
+    # reading a single body byte, so hostile requests can't force a full
+    # transfer just to be bounced. The streamed size check in
+    # _spool_upload stays as the backstop for chunked encoding, which
+    # carries no length header.
+    content_length = request.headers.get("content-length")
+    if content_length is not None and int(content_length) > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File size exceeds maximum allowed size of {MAX_FILE_SIZE / (1024*1024):.1f}MB"
+        )
+
+    if not file.filename:
+        raise HTTPException(
+            status_code=400,
+            detail="No file provided. Please upload a PDF or DOCX file."
+        )
+
+    # Parse the suffix once; the validation check, the parser dispatch and
+    # the endpoint response dicts all reuse it
+    suffix = get_file_suffix(file.filename)
+    if suffix not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file format '{suffix or 'unknown'}'. Please upload a PDF (.pdf) or DOCX (.docx) file."
+        )
+
+    # Read upload into memory (streamed, size-checked per chunk)
+    buffer, file_size, digest = await _spool_upload(file)
+
+    try:
+        # Check if file is empty
+        if file_size == 0:
+            raise HTTPException(
+                status_code=400,
+                detail="Uploaded file is empty. Please upload a valid PDF or DOCX file."
+            )
+
+        # Parse the document straight from the in-memory buffer.
+        # Parsing is CPU-bound, so run it in a thread to keep the event
+        # loop free for health checks and other requests.
+        try:
+            logger.info("Parsing document: %s", file.filename)
+            async with INFER_SEMAPHORE:
+                extracted_text = await asyncio.to_thread(
+                    parse_document, buffer, suffix=suffix
+                )
+        except DocumentParseError as e:
+            error_msg = f"Unable to parse document. The file may be corrupted or in an unsupported format. Error: {str(e)}"
+            logger.error("Document parsing error for %s: %s", file.filename, str(e))
+            raise HTTPException(status_code=400, detail=error_msg)
+        except ValueError as e:
+            error_msg = f"Invalid document: {str(e)}. Please ensure the file is a valid PDF or DOCX document."
+            logger.error("Value error for %s: %s", file.filename, str(e))
+            raise HTTPException(status_code=400, detail=error_msg)
+        except FileNotFoundError as e:
+            error_msg = f"File not found: {str(e)}. Please try uploading the file again."
+            logger.error("File not found: %s", str(e))
+            raise HTTPException(status_code=404, detail=error_msg)
+
+        if not extracted_text or not extracted_text.strip():
+            raise HTTPException(
+                status_code=400,
+                detail="Document contains no extractable text. Please ensure the document has readable content."
+            )
+
+        return extracted_text, file_size, digest, suffix
+
+    finally:
+        # Release the upload buffer
+        buffer.close()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -55,6 +296,24 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/readyz")
+async def readyz():
+    """
+    Readiness check endpoint
+
+    Unlike /health (liveness), this returns 503 until model warmup has
+    completed, so load balancers only send traffic to warm instances.
+
+    Returns:
+        JSON response with readiness state (200 when ready, 503 otherwise)
+    """
+    ready = bool(app.state.ready)
+    return ORJSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready}
+    )
+
+
 @app.get("/api/health")
 async def api_health():
     """
@@ -76,191 +335,91 @@ async def api_health():
 
 
 @app.post("/api/parse-document")
-async def parse_document_endpoint(file: UploadFile = File(...)):
+async def parse_document_endpoint(request: Request, file: UploadFile = File(...)):
     """
     Parse a document (PDF or DOCX) and extract text
-    
+
     Args:
         file: Uploaded file (PDF or DOCX)
-        
+
     Returns:
         JSON response with extracted text and metadata
     """
-    temp_file_path = None
-    
     try:
-        # Validate file extension
-        if not validate_file_extension(file.filename):
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file format. Supported formats: .pdf, .docx"
-            )
-        
-        # Generate unique filename for temporary storage
-        temp_file_path = generate_unique_filename(file.filename)
-        
-        # Save uploaded file temporarily
-        with open(temp_file_path, "wb") as buffer:
-            content = await file.read()
-            
-            # Check file size
-            if len(content) > MAX_FILE_SIZE:
-                cleanup_temp_file(temp_file_path)
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File size exceeds maximum allowed size of {MAX_FILE_SIZE / (1024*1024):.1f}MB"
-                )
-            
-            buffer.write(content)
-        
-        # Parse the document
-        try:
-            extracted_text = parse_document(temp_file_path)
-            
-            # Get file size
-            file_size = get_file_size(temp_file_path)
-            
-            return JSONResponse(
-                status_code=200,
-                content={
-                    "success": True,
-                    "filename": file.filename,
-                    "file_size": file_size,
-                    "file_type": Path(file.filename).suffix.lower(),
-                    "text_length": len(extracted_text),
-                    "word_count": len(extracted_text.split()),
-                    "text": extracted_text,
-                    "message": "Document parsed successfully"
-                }
-            )
-            
-        except DocumentParseError as e:
-            raise HTTPException(status_code=400, detail=f"Document parsing error: {str(e)}")
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=f"Invalid document: {str(e)}")
-        except FileNotFoundError as e:
-            raise HTTPException(status_code=404, detail=str(e))
-        
+        extracted_text, file_size, _, suffix = await _ingest_document(request, file)
+
+        # Plain dict return: serialized by the app-wide ORJSONResponse
+        # default, so no per-endpoint response construction is needed
+        return {
+            "success": True,
+            "filename": file.filename,
+            "file_size": file_size,
+            "file_type": suffix,
+            "text_length": len(extracted_text),
+            "word_count": _word_count(extracted_text),
+            "text": extracted_text,
+            "message": "Document parsed successfully"
+        }
+
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-    
-    finally:
-        # Clean up temporary file
-        if temp_file_path and temp_file_path.exists():
-            cleanup_temp_file(temp_file_path)
 
 
 @app.post("/api/analyze")
-async def analyze_document_endpoint(file: UploadFile = File(...)):
+async def analyze_document_endpoint(request: Request, file: UploadFile = File(...)):
     """
     Analyze a document (PDF or DOCX) and extract text
-    
+
     This endpoint:
     1. Validates file type and size
-    2. Saves file temporarily
+    2. Reads the upload into memory
     3. Parses the document to extract text
     4. Returns extracted text with metadata
-    
+
     Args:
         file: Uploaded file (PDF or DOCX)
-        
+
     Returns:
         JSON response with extracted text and metadata
-        
+
     Raises:
         HTTPException: If file validation fails or parsing errors occur
     """
-    temp_file_path = None
-    
     try:
-        # Validate file extension
-        if not validate_file_extension(file.filename):
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file format. Supported formats: .pdf, .docx"
-            )
-        
-        # Generate unique filename for temporary storage
-        temp_file_path = generate_unique_filename(file.filename)
-        
-        # Save uploaded file temporarily
-        with open(temp_file_path, "wb") as buffer:
-            content = await file.read()
-            
-            # Check file size
-            if len(content) > MAX_FILE_SIZE:
-                cleanup_temp_file(temp_file_path)
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File size exceeds maximum allowed size of {MAX_FILE_SIZE / (1024*1024):.1f}MB"
-                )
-            
-            buffer.write(content)
-        
-        # Parse the document
-        try:
-            logger.info(f"Analyzing document: {file.filename}")
-            extracted_text = parse_document(temp_file_path)
-            
-            if not extracted_text or not extracted_text.strip():
-                raise HTTPException(
-                    status_code=400,
-                    detail="Document contains no extractable text"
-                )
-            
-            # Get file size
-            file_size = get_file_size(temp_file_path)
-            
-            logger.info(f"Document analyzed successfully: {len(extracted_text)} characters extracted")
-            
-            return JSONResponse(
-                status_code=200,
-                content={
-                    "success": True,
-                    "filename": file.filename,
-                    "file_size": file_size,
-                    "file_type": Path(file.filename).suffix.lower(),
-                    "text_length": len(extracted_text),
-                    "word_count": len(extracted_text.split()),
-                    "text": extracted_text,
-                    "message": "Document analyzed successfully"
-                }
-            )
-            
-        except DocumentParseError as e:
-            error_msg = f"Unable to parse document. The file may be corrupted or in an unsupported format. Error: {str(e)}"
-            logger.error(f"Document parsing error for {file.filename}: {str(e)}")
-            raise HTTPException(status_code=400, detail=error_msg)
-        except ValueError as e:
-            error_msg = f"Invalid document: {str(e)}. Please ensure the file is a valid PDF or DOCX document."
-            logger.error(f"Value error for {file.filename}: {str(e)}")
-            raise HTTPException(status_code=400, detail=error_msg)
-        except FileNotFoundError as e:
-            error_msg = f"File not found: {str(e)}. Please try uploading the file again."
-            logger.error(f"File not found: {str(e)}")
-            raise HTTPException(status_code=404, detail=error_msg)
-        
+        logger.info("Analyzing document: %s", file.filename)
+        extracted_text, file_size, _, suffix = await _ingest_document(request, file)
+
+        logger.info("Document analyzed successfully: %d characters extracted", len(extracted_text))
+
+        # Plain dict return: serialized by the app-wide ORJSONResponse
+        # default, so no per-endpoint response construction is needed
+        return {
+            "success": True,
+            "filename": file.filename,
+            "file_size": file_size,
+            "file_type": suffix,
+            "text_length": len(extracted_text),
+            "word_count": _word_count(extracted_text),
+            "text": extracted_text,
+            "message": "Document analyzed successfully"
+        }
+
     except HTTPException:
         raise
     except Exception as e:
         error_msg = "An unexpected error occurred. Please try again or contact support if the problem persists."
-        logger.error(f"Unexpected error during document analysis: {str(e)}", exc_info=True)
+        logger.error("Unexpected error during document analysis: %s", str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=error_msg)
-    
-    finally:
-        # Clean up temporary file
-        if temp_file_path and temp_file_path.exists():
-            cleanup_temp_file(temp_file_path)
 
 
 @app.post("/api/extract-insights")
-async def extract_insights_endpoint(file: UploadFile = File(...)):
+async def extract_insights_endpoint(request: Request, file: UploadFile = File(...)):
     """
     Parse a document and extract AI-powered insights
-    
+
     This endpoint:
     1. Parses the document (PDF or DOCX)
     2. Summarizes using T5-Small (2-3 sentences)
@@ -272,83 +431,52 @@ async def extract_insights_endpoint(file: UploadFile = File(...)):
        - Brand guidelines (colors, fonts, tone)
        - Action items (tasks to do)
        - Warnings (compliance issues)
-    
+
     Args:
         file: Uploaded file (PDF or DOCX)
-        
+
     Returns:
         JSON response with extracted insights
     """
-    temp_file_path = None
-    
     try:
-        # Validate file extension
-        if not file.filename:
-            raise HTTPException(
-                status_code=400,
-                detail="No file provided. Please upload a PDF or DOCX file."
-            )
-        
-        if not validate_file_extension(file.filename):
-            file_ext = Path(file.filename).suffix.lower() if file.filename else "unknown"
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file format '{file_ext}'. Please upload a PDF (.pdf) or DOCX (.docx) file."
-            )
-        
-        # Generate unique filename for temporary storage
-        temp_file_path = generate_unique_filename(file.filename)
-        
-        # Save uploaded file temporarily
-        with open(temp_file_path, "wb") as buffer:
-            content = await file.read()
-            
-            # Check if file is empty
-            if len(content) == 0:
-                cleanup_temp_file(temp_file_path)
-                raise HTTPException(
-                    status_code=400,
-                    detail="Uploaded file is empty. Please upload a valid PDF or DOCX file."
-                )
-            
-            # Check file size
-            file_size_mb = len(content) / (1024 * 1024)
-            if len(content) > MAX_FILE_SIZE:
-                cleanup_temp_file(temp_file_path)
-                max_size_mb = MAX_FILE_SIZE / (1024 * 1024)
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File size ({file_size_mb:.2f}MB) exceeds maximum allowed size of {max_size_mb:.1f}MB. Please upload a smaller file."
-                )
-            
-            buffer.write(content)
-        
-        # Parse the document
+        extracted_text, file_size, digest, suffix = await _ingest_document(request, file)
+
+        # Compute text stats once and reuse them everywhere below
+        text_stats = {
+            "text_length": len(extracted_text),
+            "word_count": _word_count(extracted_text)
+        }
+
         try:
-            logger.info(f"Parsing document: {file.filename}")
-            extracted_text = parse_document(temp_file_path)
-            
-            if not extracted_text or not extracted_text.strip():
-                raise HTTPException(
-                    status_code=400,
-                    detail="Document contains no extractable text. Please ensure the document has readable content."
-                )
-            
-            # Extract insights using AI
-            logger.info("Starting AI extraction...")
-            extractor = AIExtractor()
-            insights = extractor.extract_insights(extracted_text)
-            
+            # Serve repeat submissions straight from the insight cache
+            cached_insights = _INSIGHT_CACHE.get(digest)
+            if cached_insights is not None:
+                _INSIGHT_CACHE.move_to_end(digest)
+                logger.info("Returning cached insights for repeated document")
+                insights = cached_insights
+            else:
+                # Extract insights using the prewarmed AI extractor.
+                # extract_insights dispatches its CPU-bound stages to
+                # worker threads itself; the shared semaphore still bounds
+                # how many extractions run at once.
+                logger.info("Starting AI extraction...")
+                extractor = get_extractor()
+                async with INFER_SEMAPHORE:
+                    insights = await extractor.extract_insights(extracted_text, precomputed_stats=text_stats)
+
+                # Cache successful extractions with LRU eviction
+                if "error" not in insights:
+                    _INSIGHT_CACHE[digest] = insights
+                    if len(_INSIGHT_CACHE) > _INSIGHT_CACHE_MAX:
+                        _INSIGHT_CACHE.popitem(last=False)
+
             # Check if extraction failed
             if "error" in insights:
                 raise HTTPException(
                     status_code=500,
                     detail=f"AI extraction failed: {insights.get('error', 'Unknown error')}. Please try again."
                 )
-            
-            # Get file size
-            file_size = get_file_size(temp_file_path)
-            
+
             # Build structured response (insights already has new structure)
             response_data = {
                 "success": True,
@@ -373,44 +501,27 @@ async def extract_insights_endpoint(file: UploadFile = File(...)):
                 "file_metadata": {
                     "filename": file.filename,
                     "file_size": file_size,
-                    "file_type": Path(file.filename).suffix.lower(),
-                    "text_length": len(extracted_text),
-                    "word_count": len(extracted_text.split())
+                    "file_type": suffix,
+                    "text_length": text_stats["text_length"],
+                    "word_count": text_stats["word_count"]
                 },
                 "metadata": insights.get("metadata", {})
             }
-            
+
             logger.info("AI extraction completed successfully")
-            
-            return JSONResponse(
-                status_code=200,
-                content=response_data
-            )
-            
-        except DocumentParseError as e:
-            error_msg = f"Unable to parse document. The file may be corrupted or in an unsupported format. Error: {str(e)}"
-            logger.error(f"Document parsing error for {file.filename}: {str(e)}")
-            raise HTTPException(status_code=400, detail=error_msg)
-        except ValueError as e:
-            error_msg = f"Invalid document: {str(e)}. Please ensure the file is a valid PDF or DOCX document."
-            logger.error(f"Value error for {file.filename}: {str(e)}")
-            raise HTTPException(status_code=400, detail=error_msg)
-        except FileNotFoundError as e:
-            error_msg = f"File not found: {str(e)}. Please try uploading the file again."
-            logger.error(f"File not found: {str(e)}")
-            raise HTTPException(status_code=404, detail=error_msg)
+
+            # Serialized by the app-wide ORJSONResponse default
+            return response_data
+
+        except HTTPException:
+            raise
         except Exception as e:
             error_msg = "An error occurred during AI extraction. Please try again or contact support if the problem persists."
-            logger.error(f"AI extraction error for {file.filename}: {str(e)}", exc_info=True)
+            logger.error("AI extraction error for %s: %s", file.filename, str(e), exc_info=True)
             raise HTTPException(status_code=500, detail=error_msg)
-        
+
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-    
-    finally:
-        # Clean up temporary file
-        if temp_file_path and temp_file_path.exists():
-            cleanup_temp_file(temp_file_path)
@@ -1,100 +1,299 @@
 """
 Document parser service for extracting text from PDF and DOCX files
+
+Parsers accept either a filesystem path or an already-open binary
+file-like object (e.g. BytesIO), so callers can parse uploads straight
+from memory without a temp-file round-trip.
 """
+import os
 import pdfplumber
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from docx import Document
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, List, Optional, Union
 import logging
 
+try:
+    # Optional: fast PDF text-layer extraction (pdfplumber stays as the
+    # fallback for scanned or layout-heavy documents)
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+try:
+    # lxml ships as a python-docx dependency; used for the fast DOCX path
+    from lxml import etree
+except ImportError:
+    etree = None
+
 logger = logging.getLogger(__name__)
 
+# Stop accumulating page text past this point: downstream consumers
+# truncate far earlier (summarization uses the first 4000 chars), so
+# parsing a huge PDF to the last page is wasted work
+MAX_TEXT_CHARS = 400_000
+
+# Documents below this page count are parsed sequentially: pool dispatch
+# overhead dominates for short PDFs
+PARALLEL_PAGE_MIN = 4
+
+# Worker pool for per-page PDF extraction, created on first use and
+# reused across requests so fork cost isn't paid per document
+_page_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    global _page_pool
+    if _page_pool is None:
+        _page_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _page_pool
+
+
+def _extract_pages_chunk(path_str: str, indices: List[int]) -> List[str]:
+    """Worker: extract text for a slice of page indices"""
+    with pdfplumber.open(path_str) as pdf:
+        return [
+            pdf.pages[i].extract_text(x_tolerance=1.5, y_tolerance=1.5) or ""
+            for i in indices
+        ]
+
+
+def _extract_pdf_parallel(path: Path) -> Optional[List[str]]:
+    """
+    Extract page text across a process pool for multi-page PDFs
+
+    Pages are independent CPU-bound work, so slicing them across cores
+    scales near-linearly on long documents. Only applies to path sources
+    (workers reopen the file); returns None for short documents or on any
+    failure so the caller falls back to sequential extraction.
+    """
+    try:
+        with pdfplumber.open(path) as pdf:
+            page_count = len(pdf.pages)
+        if page_count < PARALLEL_PAGE_MIN:
+            return None
+
+        workers = min(os.cpu_count() or 1, page_count)
+        chunks = [list(range(start, page_count, workers)) for start in range(workers)]
+        pool = _get_page_pool()
+        results = list(pool.map(_extract_pages_chunk, [str(path)] * workers, chunks))
+
+        # Reassemble in page order from the strided chunks
+        pages = [""] * page_count
+        for chunk, chunk_texts in zip(chunks, results):
+            for index, page_text in zip(chunk, chunk_texts):
+                pages[index] = page_text
+        parts = [p for p in pages if p]
+        return parts or None
+    except Exception as e:
+        logger.warning("Parallel PDF extraction failed (%s); falling back", str(e))
+        return None
+
 
 class DocumentParseError(Exception):
     """Custom exception for document parsing errors"""
     pass
 
 
-def extract_text_from_pdf(file_path: Path) -> str:
+def _check_source(source: Union[Path, BinaryIO], file_kind: str) -> None:
+    """
+    Validate a parse source before handing it to a parser library
+
+    For paths, checks existence and non-zero size. For file-like objects,
+    rewinds to the start so the parser reads the full content.
+
+    Raises:
+        FileNotFoundError: If a path source does not exist
+        ValueError: If the source is empty
+    """
+    if isinstance(source, Path):
+        if not source.exists():
+            raise FileNotFoundError(f"{file_kind} file not found: {source}")
+        if source.stat().st_size == 0:
+            raise ValueError(f"{file_kind} file is empty: {source}")
+    else:
+        source.seek(0, 2)  # Seek to end to measure size
+        if source.tell() == 0:
+            raise ValueError(f"{file_kind} file is empty")
+        source.seek(0)
+
+
+
+def _extract_pdf_text_fast(source: Union[Path, BinaryIO], max_chars: int = MAX_TEXT_CHARS) -> Optional[List[str]]:
+    """
+    Extract per-page text with pypdf, skipping pages without a text layer
+
+    Returns:
+        List of non-empty page texts, or None when pypdf is unavailable,
+        errors out, or finds no text (callers then fall back to pdfplumber)
+    """
+    if PdfReader is None:
+        return None
+
+    try:
+        reader = PdfReader(source)
+        parts = []
+        total = 0
+        for page in reader.pages:
+            page_text = page.extract_text()
+            if page_text:
+                parts.append(page_text)
+                total += len(page_text)
+                if total > max_chars:
+                    break
+        return parts or None
+    except Exception as e:
+        logger.debug("pypdf fast path failed (%s); using pdfplumber", str(e))
+        return None
+
+
+def extract_text_from_pdf(source: Union[Path, BinaryIO], max_chars: Optional[int] = None) -> str:
     """
     Extract text content from a PDF file
-    
+
     Args:
-        file_path: Path to the PDF file
-        
+        source: Path to the PDF file, or an open binary file-like object
+        max_chars: Stop extracting once this much text is collected
+            (defaults to MAX_TEXT_CHARS); bounds parse latency on huge
+            PDFs whose tail no downstream consumer would read anyway
+
     Returns:
         Extracted text as a string
-        
+
     Raises:
         DocumentParseError: If file cannot be parsed or is corrupted
         FileNotFoundError: If file does not exist
         ValueError: If file is empty or has no readable content
     """
-    # Check if file exists
-    if not file_path.exists():
-        raise FileNotFoundError(f"PDF file not found: {file_path}")
-    
-    # Check if file is empty
-    if file_path.stat().st_size == 0:
-        raise ValueError(f"PDF file is empty: {file_path}")
-    
-    text = ""
+    _check_source(source, "PDF")
+    limit = max_chars if max_chars is not None else MAX_TEXT_CHARS
+
+    # Fast path: pypdf reads the text layer directly without running
+    # pdfplumber's layout analysis. An empty result (scanned or
+    # layout-heavy PDF) falls through to the pdfplumber path below.
+    parts = _extract_pdf_text_fast(source, limit)
+
+    # Path sources with enough pages get parallel per-page extraction
+    if parts is None and isinstance(source, Path):
+        parts = _extract_pdf_parallel(source)
+
+    if parts is None:
+        if not isinstance(source, Path):
+            source.seek(0)  # Rewind after the fast-path attempt
+        parts = []
+        try:
+            with pdfplumber.open(source) as pdf:
+                # Check if PDF has pages
+                if len(pdf.pages) == 0:
+                    raise ValueError(f"PDF file has no pages: {source}")
+
+                total = 0
+                for page_num, page in enumerate(pdf.pages, 1):
+                    try:
+                        page_text = page.extract_text(x_tolerance=1.5, y_tolerance=1.5)
+                        if page_text:
+                            parts.append(page_text)
+                            total += len(page_text)
+                            if total > limit:
+                                break
+                    except Exception as e:
+                        logger.warning("Error extracting text from page %d: %s", page_num, str(e))
+                        continue
+
+        except FileNotFoundError:
+            raise
+        except ValueError:
+            raise
+        except pdfplumber.PDFSyntaxError as e:
+            raise DocumentParseError(f"PDF file appears to be corrupted or invalid: {str(e)}")
+        except Exception as e:
+            raise DocumentParseError(f"Error extracting text from PDF: {str(e)}")
+
+    # Join once instead of growing the accumulator string per page
+    text = "\n".join(parts).strip()
+
+    # Check if any text was extracted
+    if not text:
+        raise ValueError(f"PDF file contains no extractable text: {source}")
+
+    return text
+
+
+
+# WordprocessingML namespace used by word/document.xml
+_DOCX_W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+
+def _extract_docx_text_fast(source: Union[Path, BinaryIO]) -> Optional[List[str]]:
+    """
+    Extract paragraph text by reading word/document.xml directly
+
+    Skips python-docx's Paragraph/Run object model — one lxml sweep over
+    the raw XML instead of materializing thousands of wrapper objects.
+    Documents containing tables fall back to python-docx (returns None)
+    because downstream extractors rely on its " | " cell joining.
+
+    Returns:
+        List of paragraph texts, or None when the fast path doesn't apply
+    """
+    if etree is None:
+        return None
+
     try:
-        with pdfplumber.open(file_path) as pdf:
-            # Check if PDF has pages
-            if len(pdf.pages) == 0:
-                raise ValueError(f"PDF file has no pages: {file_path}")
-            
-            for page_num, page in enumerate(pdf.pages, 1):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                except Exception as e:
-                    logger.warning(f"Error extracting text from page {page_num}: {str(e)}")
-                    continue
-            
-            # Check if any text was extracted
-            if not text.strip():
-                raise ValueError(f"PDF file contains no extractable text: {file_path}")
-                
-    except FileNotFoundError:
-        raise
-    except ValueError:
-        raise
-    except pdfplumber.PDFSyntaxError as e:
-        raise DocumentParseError(f"PDF file appears to be corrupted or invalid: {str(e)}")
-    except Exception as e:
-        raise DocumentParseError(f"Error extracting text from PDF: {str(e)}")
-    
-    return text.strip()
+        with zipfile.ZipFile(source) as archive:
+            xml = archive.read('word/document.xml')
+    except (zipfile.BadZipFile, KeyError, OSError):
+        # Let python-docx produce its usual corruption errors
+        return None
+
+    if b'<w:tbl' in xml:
+        return None
+
+    try:
+        root = etree.fromstring(xml)
+    except Exception:
+        return None
+
+    paragraph_tag = '{%s}p' % _DOCX_W_NS
+    text_tag = '{%s}t' % _DOCX_W_NS
+    parts = []
+    for paragraph in root.iter(paragraph_tag):
+        runs = [node.text for node in paragraph.iter(text_tag) if node.text]
+        if runs:
+            paragraph_text = ''.join(runs).strip()
+            if paragraph_text:
+                parts.append(paragraph_text)
+    return parts or None
 
 
-def extract_text_from_docx(file_path: Path) -> str:
+def extract_text_from_docx(source: Union[Path, BinaryIO]) -> str:
     """
     Extract text content from a DOCX file
-    
+
     Args:
-        file_path: Path to the DOCX file
-        
+        source: Path to the DOCX file, or an open binary file-like object
+
     Returns:
         Extracted text as a string
-        
+
     Raises:
         DocumentParseError: If file cannot be parsed or is corrupted
         FileNotFoundError: If file does not exist
         ValueError: If file is empty or has no readable content
     """
-    # Check if file exists
-    if not file_path.exists():
-        raise FileNotFoundError(f"DOCX file not found: {file_path}")
-    
-    # Check if file is empty
-    if file_path.stat().st_size == 0:
-        raise ValueError(f"DOCX file is empty: {file_path}")
-    
+    _check_source(source, "DOCX")
+
+    # Fast path: read the XML directly when the document has no tables
+    parts = _extract_docx_text_fast(source)
+    if parts is not None:
+        return "\n".join(parts).strip()
+
+    if not isinstance(source, Path):
+        source.seek(0)  # Rewind after the fast-path attempt
+
     try:
-        doc = Document(file_path)
+        doc = Document(source)
         
         # Extract text from paragraphs
         paragraphs_text = [paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()]
@@ -112,7 +311,7 @@ def extract_text_from_docx(file_path: Path) -> str:
         
         # Check if any text was extracted
         if not all_text:
-            raise ValueError(f"DOCX file contains no extractable text: {file_path}")
+            raise ValueError(f"DOCX file contains no extractable text: {source}")
         
         text = "\n".join(all_text)
         
@@ -124,7 +323,7 @@ def extract_text_from_docx(file_path: Path) -> str:
         # Check for common DOCX errors
         error_msg = str(e).lower()
         if "not a zip file" in error_msg or "bad zipfile" in error_msg:
-            raise DocumentParseError(f"DOCX file appears to be corrupted or invalid (not a valid ZIP archive): {file_path}")
+            raise DocumentParseError(f"DOCX file appears to be corrupted or invalid (not a valid ZIP archive): {source}")
         elif "cannot open" in error_msg or "invalid" in error_msg:
             raise DocumentParseError(f"DOCX file cannot be opened or is invalid: {str(e)}")
         else:
@@ -133,33 +332,39 @@ def extract_text_from_docx(file_path: Path) -> str:
     return text.strip()
 
 
-def parse_document(file_path: Path) -> str:
+def parse_document(source: Union[Path, BinaryIO], suffix: Optional[str] = None, max_chars: Optional[int] = None) -> str:
     """
     Parse a document and extract text based on file extension
-    
+
     Args:
-        file_path: Path to the document file
-        
+        source: Path to the document file, or an open binary file-like
+            object (in which case `suffix` must be provided)
+        suffix: File extension (e.g. ".pdf") when parsing a file-like object
+        max_chars: Optional cap on extracted PDF text (see
+            extract_text_from_pdf)
+
     Returns:
         Extracted text as a string
-        
+
     Raises:
-        ValueError: If file extension is not supported
+        ValueError: If file extension is not supported or missing
         FileNotFoundError: If file does not exist
         DocumentParseError: If file cannot be parsed
     """
-    # Validate file path
-    if not isinstance(file_path, Path):
-        file_path = Path(file_path)
-    
-    file_extension = file_path.suffix.lower()
-    
+    if isinstance(source, (str, Path)):
+        source = Path(source)
+        file_extension = source.suffix.lower()
+    else:
+        if not suffix:
+            raise ValueError("suffix is required when parsing a file-like object")
+        file_extension = suffix.lower()
+
     # Check if extension is supported
     if file_extension not in [".pdf", ".docx"]:
         raise ValueError(f"Unsupported file format: {file_extension}. Supported formats: .pdf, .docx")
-    
+
     # Route to appropriate parser
     if file_extension == ".pdf":
-        return extract_text_from_pdf(file_path)
+        return extract_text_from_pdf(source, max_chars=max_chars)
     elif file_extension == ".docx":
-        return extract_text_from_docx(file_path)
+        return extract_text_from_docx(source)
@@ -12,18 +12,79 @@ from transformers import (
     AutoTokenizer, 
     AutoModelForSequenceClassification,
     T5ForConditionalGeneration,
-    T5Tokenizer
+    T5TokenizerFast
 )
 import torch
 import logging
+import os
+import platform
+from pathlib import Path
 from typing import Tuple, Optional
-from config import T5_MODEL_NAME, DISTILBERT_MODEL_NAME, DEVICE
+from config import (
+    T5_MODEL_NAME, DISTILBERT_MODEL_NAME, DEVICE, QUANTIZE_INT8,
+    USE_ONNX, ONNX_MODEL_DIR, USE_BF16, TORCH_COMPILE
+)
+
+try:
+    # Optional: ONNX Runtime backends (pip install optimum[onnxruntime])
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTModelForSequenceClassification
+except ImportError:
+    ORTModelForSeq2SeqLM = None
+    ORTModelForSequenceClassification = None
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured once at the application entrypoint (main.py)
 logger = logging.getLogger(__name__)
 
 
+def prefetch_model_weights() -> int:
+    """
+    Ask the OS to pull cached model weight files into the page cache
+
+    Model weights are mmap'd at load time, so a cold start pays page
+    faults one-by-one during the first forward pass. Advising the kernel
+    with POSIX_FADV_WILLNEED turns that stall into a background prefetch,
+    cutting first-inference latency. No-ops on platforms without
+    posix_fadvise (e.g. Windows).
+
+    Returns:
+        Number of weight files prefetched
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return 0
+
+    # Resolve the Hugging Face cache directory (env vars first)
+    cache_root = None
+    for env_var in ('HF_HOME', 'TRANSFORMERS_CACHE', 'HUGGINGFACE_HUB_CACHE'):
+        value = os.getenv(env_var)
+        if value and os.path.isdir(value):
+            cache_root = Path(value)
+            break
+    if cache_root is None:
+        default_root = Path.home() / '.cache' / 'huggingface'
+        if default_root.is_dir():
+            cache_root = default_root
+
+    if cache_root is None:
+        return 0
+
+    prefetched = 0
+    for pattern in ('**/*.safetensors', '**/*.bin'):
+        for weight_file in cache_root.glob(pattern):
+            try:
+                fd = os.open(weight_file, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+                prefetched += 1
+            except OSError:
+                continue
+
+    if prefetched:
+        logger.info(f"Prefetched {prefetched} model weight file(s) into page cache")
+    return prefetched
+
+
 class ModelLoader:
     """
     Singleton class to manage model loading and caching
@@ -37,7 +98,7 @@ class ModelLoader:
     """
     
     _instance = None
-    _t5_tokenizer: Optional[T5Tokenizer] = None
+    _t5_tokenizer: Optional[T5TokenizerFast] = None
     _t5_model: Optional[T5ForConditionalGeneration] = None
     _distilbert_tokenizer: Optional[AutoTokenizer] = None
     _distilbert_model: Optional[AutoModelForSequenceClassification] = None
@@ -47,7 +108,95 @@ class ModelLoader:
             cls._instance = super(ModelLoader, cls).__new__(cls)
         return cls._instance
     
-    def load_t5_model(self) -> Tuple[T5ForConditionalGeneration, T5Tokenizer]:
+    def _load_t5_onnx(self):
+        """
+        Load T5-Small through ONNX Runtime, exporting on first use
+
+        The exported encoder/decoder/decoder-with-past graphs are saved to
+        ONNX_MODEL_DIR so later starts skip the export and load the cached
+        sessions directly. ONNX Runtime fuses attention/LayerNorm/GELU and
+        reuses the KV cache across decode steps, typically 1.2-2x faster
+        than eager PyTorch on CPU.
+
+        Returns:
+            ORT model exposing the same generate() API as the HF model,
+            or None when the optimum dependency is unavailable
+        """
+        if ORTModelForSeq2SeqLM is None:
+            logger.warning(
+                "USE_ONNX is set but optimum[onnxruntime] is not installed; "
+                "falling back to the PyTorch backend"
+            )
+            return None
+
+        try:
+            if not (ONNX_MODEL_DIR / "encoder_model.onnx").exists():
+                logger.info("Exporting %s to ONNX (one-time cost)...", T5_MODEL_NAME)
+                model = ORTModelForSeq2SeqLM.from_pretrained(
+                    T5_MODEL_NAME,
+                    export=True,
+                    use_cache=True,
+                    provider="CPUExecutionProvider"
+                )
+                # Persist the exported graphs so the export is amortized
+                ONNX_MODEL_DIR.mkdir(exist_ok=True)
+                model.save_pretrained(ONNX_MODEL_DIR)
+                logger.info("ONNX T5 model exported and cached at %s", ONNX_MODEL_DIR)
+
+            # Prefer the INT8-quantized graphs when enabled and available
+            file_kwargs = {}
+            if QUANTIZE_INT8 and self._quantize_onnx():
+                file_kwargs = {
+                    "encoder_file_name": "encoder_model_quantized.onnx",
+                    "decoder_file_name": "decoder_model_quantized.onnx",
+                    "decoder_with_past_file_name": "decoder_with_past_model_quantized.onnx",
+                }
+
+            logger.info("Loading cached ONNX T5 model from %s", ONNX_MODEL_DIR)
+            return ORTModelForSeq2SeqLM.from_pretrained(
+                ONNX_MODEL_DIR,
+                provider="CPUExecutionProvider",
+                **file_kwargs
+            )
+        except Exception as e:
+            logger.warning("ONNX export/load failed (%s); falling back to PyTorch", str(e))
+            return None
+
+    @staticmethod
+    def _quantize_onnx() -> bool:
+        """
+        Dynamically quantize the cached ONNX graphs to INT8 weights
+
+        Rewrites each exported graph with QuantizeLinear/DequantizeLinear
+        nodes (~4x smaller weight files, 1.5-2x faster GEMMs on VNNI
+        CPUs). Quantized copies are written next to the FP32 originals
+        and reused on later starts.
+
+        Returns:
+            True when quantized graphs are present, False otherwise
+        """
+        try:
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+        except ImportError:
+            return False
+
+        try:
+            for name in ('encoder_model', 'decoder_model', 'decoder_with_past_model'):
+                source = ONNX_MODEL_DIR / f'{name}.onnx'
+                target = ONNX_MODEL_DIR / f'{name}_quantized.onnx'
+                if source.exists() and not target.exists():
+                    logger.info("Quantizing %s to INT8...", source.name)
+                    quantize_dynamic(
+                        str(source), str(target),
+                        weight_type=QuantType.QInt8,
+                        per_channel=True
+                    )
+            return (ONNX_MODEL_DIR / 'encoder_model_quantized.onnx').exists()
+        except Exception as e:
+            logger.warning("ONNX quantization failed (%s); using FP32 graphs", str(e))
+            return False
+
+    def load_t5_model(self) -> Tuple[T5ForConditionalGeneration, T5TokenizerFast]:
         """
         Load T5-Small model for text summarization
         
@@ -66,25 +215,95 @@ class ModelLoader:
         """
         if self._t5_model is None or self._t5_tokenizer is None:
             try:
+                # A single interop thread avoids oversubscription between
+                # the inter-op and intra-op pools during generation; it
+                # can only be set before parallel work starts, hence the
+                # guard (a second call raises RuntimeError)
+                try:
+                    torch.set_num_interop_threads(1)
+                except RuntimeError:
+                    pass
+
                 logger.info(f"Loading T5-Small model ({T5_MODEL_NAME})...")
                 logger.info("First-time use: Model will be downloaded from Hugging Face (~5 min)")
                 
                 # Load tokenizer and model
                 # Auto-downloads from Hugging Face if not cached locally
                 # Caches in ~/.cache/huggingface/transformers by default
-                self._t5_tokenizer = T5Tokenizer.from_pretrained(
-                    T5_MODEL_NAME,
-                    cache_dir=None  # Uses default Hugging Face cache directory
-                )
-                self._t5_model = T5ForConditionalGeneration.from_pretrained(
+                # Fast (Rust-backed) tokenizer: encodes long inputs an
+                # order of magnitude faster than the pure-Python
+                # SentencePiece wrapper and releases the GIL while at it
+                self._t5_tokenizer = T5TokenizerFast.from_pretrained(
                     T5_MODEL_NAME,
                     cache_dir=None  # Uses default Hugging Face cache directory
                 )
-                
-                # Move model to device (CPU or CUDA)
-                self._t5_model.to(DEVICE)
-                self._t5_model.eval()  # Set to evaluation mode
-                
+
+                # Optional ONNX Runtime backend (generate() API-compatible)
+                if USE_ONNX:
+                    self._t5_model = self._load_t5_onnx()
+
+                if self._t5_model is None:
+                    self._t5_model = T5ForConditionalGeneration.from_pretrained(
+                        T5_MODEL_NAME,
+                        cache_dir=None  # Uses default Hugging Face cache directory
+                    )
+
+                    # Move model to device (CPU or CUDA)
+                    self._t5_model.to(DEVICE)
+                    self._t5_model.eval()  # Set to evaluation mode
+
+                    # Optional BF16 path via Intel Extension for PyTorch:
+                    # AMX/AVX-512-BF16 matmul tiles roughly double GEMM
+                    # throughput on capable Xeons. Takes precedence over
+                    # INT8 quantization when enabled
+                    bf16_applied = False
+                    if USE_BF16:
+                        try:
+                            import intel_extension_for_pytorch as ipex
+                            self._t5_model = ipex.optimize(
+                                self._t5_model, dtype=torch.bfloat16
+                            )
+                            bf16_applied = True
+                            logger.info("T5-Small optimized for BF16 via IPEX")
+                        except ImportError:
+                            logger.warning(
+                                "USE_BF16 is set but intel_extension_for_pytorch "
+                                "is not installed; continuing in FP32"
+                            )
+                        except Exception as e:
+                            logger.warning("IPEX BF16 optimization failed: %s", str(e))
+
+                    # Quantize linear layers to INT8 for faster CPU decode
+                    # (the ONNX path has its own quantization story)
+                    if QUANTIZE_INT8 and not bf16_applied:
+                        # Pick the INT8 kernel backend for this CPU:
+                        # fbgemm on x86 (uses AVX-512 VNNI where present),
+                        # qnnpack on ARM
+                        engine = 'fbgemm' if platform.machine() in ('x86_64', 'AMD64') else 'qnnpack'
+                        if engine in torch.backends.quantized.supported_engines:
+                            torch.backends.quantized.engine = engine
+                        logger.info("Applying dynamic INT8 quantization to T5-Small...")
+                        self._t5_model = torch.quantization.quantize_dynamic(
+                            self._t5_model, {torch.nn.Linear}, dtype=torch.qint8
+                        )
+
+                    # Optionally compile the model so the generate loop
+                    # runs through a fused graph instead of per-op Python
+                    # dispatch. The compile itself is lazy; the startup
+                    # warmup inference pays the one-time compile cost so
+                    # the first user request doesn't
+                    if TORCH_COMPILE and hasattr(torch, "compile"):
+                        try:
+                            self._t5_model = torch.compile(
+                                self._t5_model,
+                                mode="reduce-overhead",
+                                fullgraph=False,
+                                dynamic=True
+                            )
+                            logger.info("T5-Small wrapped with torch.compile")
+                        except Exception as e:
+                            logger.warning("torch.compile failed: %s", str(e))
+
                 logger.info(f"T5-Small model loaded successfully on {DEVICE}")
                 
             except ConnectionError as e:
@@ -101,6 +320,45 @@ class ModelLoader:
         
         return self._t5_model, self._t5_tokenizer
     
+
+    def _load_distilbert_onnx(self):
+        """
+        Load DistilBERT through ONNX Runtime, exporting on first use
+
+        Same scheme as the T5 path: export once, cache the graph under
+        ONNX_MODEL_DIR/distilbert, and load the session directly on later
+        starts. Returns None when optimum is unavailable or export fails.
+        """
+        if ORTModelForSequenceClassification is None:
+            logger.warning(
+                "USE_ONNX is set but optimum[onnxruntime] is not installed; "
+                "falling back to the PyTorch backend"
+            )
+            return None
+
+        cache_dir = ONNX_MODEL_DIR / "distilbert"
+        try:
+            if (cache_dir / "model.onnx").exists():
+                logger.info("Loading cached ONNX DistilBERT model from %s", cache_dir)
+                return ORTModelForSequenceClassification.from_pretrained(
+                    cache_dir,
+                    provider="CPUExecutionProvider"
+                )
+
+            logger.info("Exporting %s to ONNX (one-time cost)...", DISTILBERT_MODEL_NAME)
+            model = ORTModelForSequenceClassification.from_pretrained(
+                DISTILBERT_MODEL_NAME,
+                export=True,
+                provider="CPUExecutionProvider"
+            )
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            model.save_pretrained(cache_dir)
+            logger.info("ONNX DistilBERT model exported and cached at %s", cache_dir)
+            return model
+        except Exception as e:
+            logger.warning("ONNX export/load failed (%s); falling back to PyTorch", str(e))
+            return None
+
     def load_distilbert_model(self) -> Tuple[AutoModelForSequenceClassification, AutoTokenizer]:
         """
         Load DistilBERT model for document classification
@@ -130,15 +388,46 @@ class ModelLoader:
                     DISTILBERT_MODEL_NAME,
                     cache_dir=None  # Uses default Hugging Face cache directory
                 )
-                self._distilbert_model = AutoModelForSequenceClassification.from_pretrained(
-                    DISTILBERT_MODEL_NAME,
-                    cache_dir=None  # Uses default Hugging Face cache directory
-                )
-                
-                # Move model to device (CPU or CUDA)
-                self._distilbert_model.to(DEVICE)
-                self._distilbert_model.eval()  # Set to evaluation mode
-                
+                # Optional ONNX Runtime backend (forward API-compatible)
+                if USE_ONNX:
+                    self._distilbert_model = self._load_distilbert_onnx()
+
+                if self._distilbert_model is None:
+                    self._distilbert_model = AutoModelForSequenceClassification.from_pretrained(
+                        DISTILBERT_MODEL_NAME,
+                        cache_dir=None  # Uses default Hugging Face cache directory
+                    )
+
+                    # Move model to device (CPU or CUDA)
+                    self._distilbert_model.to(DEVICE)
+                    self._distilbert_model.eval()  # Set to evaluation mode
+
+                    # DistilBERT classification is matmul-bound, so the
+                    # same dynamic INT8 quantization applied to T5 pays
+                    # off here too: ~2x smaller weights and faster Linear
+                    # layers on VNNI-capable CPUs. CPU-only (encoded in
+                    # the QUANTIZE_INT8 flag)
+                    if QUANTIZE_INT8:
+                        logger.info("Applying dynamic INT8 quantization to DistilBERT...")
+                        self._distilbert_model = torch.quantization.quantize_dynamic(
+                            self._distilbert_model, {torch.nn.Linear}, dtype=torch.qint8
+                        )
+
+                # Same opt-in graph capture as the T5 path: repeated
+                # small-batch forwards reuse the compiled graph instead
+                # of paying eager-mode dispatch every call
+                if TORCH_COMPILE and hasattr(torch, "compile"):
+                    try:
+                        self._distilbert_model = torch.compile(
+                            self._distilbert_model,
+                            mode="reduce-overhead",
+                            fullgraph=False,
+                            dynamic=True
+                        )
+                        logger.info("DistilBERT wrapped with torch.compile")
+                    except Exception as e:
+                        logger.warning("torch.compile failed: %s", str(e))
+
                 logger.info(f"DistilBERT model loaded successfully on {DEVICE}")
                 
             except ConnectionError as e:
@@ -161,7 +450,7 @@ class ModelLoader:
             self.load_t5_model()
         return self._t5_model
     
-    def get_t5_tokenizer(self) -> T5Tokenizer:
+    def get_t5_tokenizer(self) -> T5TokenizerFast:
         """Get the loaded T5-Small tokenizer (lazy loading)"""
         if self._t5_tokenizer is None:
             self.load_t5_model()
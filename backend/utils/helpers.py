@@ -2,9 +2,9 @@
 Utility helper functions
 """
 import os
+import tempfile
 from pathlib import Path
 from typing import Optional
-import uuid
 from config import TEMP_UPLOADS_DIR, ALLOWED_EXTENSIONS
 
 
@@ -18,24 +18,49 @@ def validate_file_extension(filename: str) -> bool:
     Returns:
         True if extension is allowed, False otherwise
     """
-    file_path = Path(filename)
-    return file_path.suffix.lower() in ALLOWED_EXTENSIONS
+    return get_file_suffix(filename) in ALLOWED_EXTENSIONS
+
+
+def get_file_suffix(filename: str) -> str:
+    """
+    Get the lowercased file extension (including the dot)
+
+    Pure string parsing — avoids allocating a Path object per call in
+    hot request paths.
+
+    Args:
+        filename: Name of the file
+
+    Returns:
+        Extension like ".pdf", or "" if the filename has none
+    """
+    index = filename.rfind('.')
+    if index <= 0:  # No dot, or a dotfile like ".env"
+        return ""
+    return filename[index:].lower()
 
 
 def generate_unique_filename(original_filename: str) -> Path:
     """
-    Generate a unique filename for temporary storage
-    
+    Create a unique temporary file for storage and return its path
+
+    Uses NamedTemporaryFile so the file is created atomically with one
+    openat call (no uuid + stat round-trip and no name-collision window).
+    The caller owns the file and removes it with cleanup_temp_file.
+
     Args:
         original_filename: Original name of the uploaded file
-        
+
     Returns:
-        Path object with unique filename in temp_uploads directory
+        Path object of the created file in the temp_uploads directory
     """
-    file_extension = Path(original_filename).suffix
-    unique_id = str(uuid.uuid4())
-    unique_filename = f"{unique_id}{file_extension}"
-    return TEMP_UPLOADS_DIR / unique_filename
+    tmp = tempfile.NamedTemporaryFile(
+        delete=False,
+        dir=str(TEMP_UPLOADS_DIR),
+        suffix=get_file_suffix(original_filename)
+    )
+    tmp.close()
+    return Path(tmp.name)
 
 
 def cleanup_temp_file(file_path: Path) -> bool:
@@ -48,12 +73,14 @@ def cleanup_temp_file(file_path: Path) -> bool:
     Returns:
         True if file was deleted, False otherwise
     """
+    # Skip the exists() pre-check: unlink directly and treat a missing
+    # file as "nothing to delete", saving a stat syscall per call
     try:
-        if file_path.exists():
-            file_path.unlink()
-            return True
+        os.unlink(file_path)
+        return True
+    except FileNotFoundError:
         return False
-    except Exception:
+    except OSError:
         return False
 
 
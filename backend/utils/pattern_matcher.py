@@ -11,11 +11,22 @@ This module uses regex patterns and keyword matching to extract:
 
 No heavy models needed - fast pattern matching only.
 """
+import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import logging
 
+try:
+    # Optional: C-level multi-keyword scanning (pip install pyahocorasick).
+    # Falls back to plain Python substring loops when unavailable
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,21 +39,25 @@ class PatternMatcher:
     
     def _compile_patterns(self):
         """Compile all regex patterns for reuse"""
-        # Dimensions: 1080x1080, 1200x628, 1920x1080, etc.
-        self.dimension_pattern = re.compile(
-            r'\b(\d{3,5})\s*[x×]\s*(\d{3,5})\b',
-            re.IGNORECASE
-        )
-        
         # File formats: JPG, PNG, PDF, MP4, etc.
         self.format_pattern = re.compile(
             r'\b(?:format|file type|extension):\s*([A-Z0-9]{2,5})\b',
             re.IGNORECASE
         )
-        
-        # File sizes: 5MB, 10 MB, 2.5MB, etc.
-        self.file_size_pattern = re.compile(
-            r'\b(\d+(?:\.\d+)?)\s*(MB|KB|GB|mb|kb|gb)\b',
+
+        # Dimensions (1080x1080, 1200x628, ...) and file sizes (5MB,
+        # 2.5 MB, ...) fused into one scan (see kpi_union); lastgroup
+        # routes each hit to the right spec bucket
+        self._techspec_re = re.compile(
+            r'\b(?P<dim>(?P<dim_w>\d{3,5})\s*[x×]\s*(?P<dim_h>\d{3,5}))\b'
+            r'|\b(?P<size>(?P<size_n>\d+(?:\.\d+)?)\s*(?P<size_u>MB|KB|GB))\b',
+            re.IGNORECASE
+        )
+
+        # Common format mentions as one alternation: a single findall
+        # pass instead of nine word-boundary searches per document
+        self._common_fmt_re = re.compile(
+            r'\b(JPG|JPEG|PNG|PDF|MP4|MOV|GIF|SVG|WEBP)\b',
             re.IGNORECASE
         )
         
@@ -53,36 +68,56 @@ class PatternMatcher:
             re.compile(r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b'),
             re.compile(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{1,2},?\s+\d{4}\b', re.IGNORECASE),
         ]
-        
+        # Combined form scanned once per document; finditer yields the
+        # match offset directly so extract_deadlines never has to
+        # re-find each date in the text
+        self.date_union = re.compile(
+            '|'.join(f'(?:{p.pattern})' for p in self.date_patterns),
+            re.IGNORECASE
+        )
+
         # Deadline keywords
         self.deadline_keywords = [
             'deadline', 'due by', 'due date', 'submit before', 'submit by',
             'deliver by', 'delivery date', 'must be received by', 'needed by',
             'required by', 'final date', 'cutoff date', 'closing date'
         ]
+        # One C-level search over a date's context window instead of a
+        # Python loop of `keyword in context` checks
+        self.deadline_kw_re = re.compile('|'.join(map(re.escape, self.deadline_keywords)))
         
         # KPI patterns: CTR, CPC, CPM, conversion rate, etc.
-        self.kpi_patterns = [
-            re.compile(r'\b(?:CTR|Click-Through Rate|click through rate):\s*(\d+(?:\.\d+)?)\s*%?\b', re.IGNORECASE),
-            re.compile(r'\b(?:CPC|Cost Per Click):\s*\$?(\d+(?:\.\d+)?)\b', re.IGNORECASE),
-            re.compile(r'\b(?:CPM|Cost Per Mille|Cost Per Thousand):\s*\$?(\d+(?:\.\d+)?)\b', re.IGNORECASE),
-            re.compile(r'\b(?:conversion rate|conversion):\s*(\d+(?:\.\d+)?)\s*%?\b', re.IGNORECASE),
-            re.compile(r'\b(?:ROAS|Return on Ad Spend):\s*(\d+(?:\.\d+)?)\b', re.IGNORECASE),
-            re.compile(r'\b(?:CPA|Cost Per Acquisition):\s*\$?(\d+(?:\.\d+)?)\b', re.IGNORECASE),
-            re.compile(r'\b(?:impressions|impression count):\s*(\d+(?:,\d{3})*(?:\.\d+)?)\b', re.IGNORECASE),
-            re.compile(r'\b(?:clicks|click count):\s*(\d+(?:,\d{3})*(?:\.\d+)?)\b', re.IGNORECASE),
+        # All alternatives are merged into one pattern so extract_kpis
+        # makes a single pass over the text instead of eight. Each entry
+        # has an outer group named after the KPI and an inner <name>_v
+        # group capturing the numeric value
+        kpi_specs = [
+            ('CTR', r'\b(?:CTR|Click-Through Rate|click through rate):\s*(?P<CTR_v>\d+(?:\.\d+)?)\s*%?\b'),
+            ('CPC', r'\b(?:CPC|Cost Per Click):\s*\$?(?P<CPC_v>\d+(?:\.\d+)?)\b'),
+            ('CPM', r'\b(?:CPM|Cost Per Mille|Cost Per Thousand):\s*\$?(?P<CPM_v>\d+(?:\.\d+)?)\b'),
+            ('conversion_rate', r'\b(?:conversion rate|conversion):\s*(?P<conversion_rate_v>\d+(?:\.\d+)?)\s*%?\b'),
+            ('ROAS', r'\b(?:ROAS|Return on Ad Spend):\s*(?P<ROAS_v>\d+(?:\.\d+)?)\b'),
+            ('CPA', r'\b(?:CPA|Cost Per Acquisition):\s*\$?(?P<CPA_v>\d+(?:\.\d+)?)\b'),
+            ('impressions', r'\b(?:impressions|impression count):\s*(?P<impressions_v>\d+(?:,\d{3})*(?:\.\d+)?)\b'),
+            ('clicks', r'\b(?:clicks|click count):\s*(?P<clicks_v>\d+(?:,\d{3})*(?:\.\d+)?)\b'),
         ]
+        self.kpi_union = re.compile(
+            '|'.join(f'(?P<{name}>{body})' for name, body in kpi_specs),
+            re.IGNORECASE
+        )
         
         # Color patterns: hex codes, RGB, color names
         self.color_patterns = [
             re.compile(r'\b#([0-9A-Fa-f]{6}|[0-9A-Fa-f]{3})\b'),  # Hex colors
             re.compile(r'\bRGB\((\d+),\s*(\d+),\s*(\d+)\)\b', re.IGNORECASE),
-            re.compile(r'\b(?:color|primary color|brand color):\s*([A-Za-z]+(?:\s+[A-Za-z]+)?)\b', re.IGNORECASE),
+            re.compile(r'\b(?:color|primary color|brand color):\s*([A-Za-z]{1,20}(?:\s[A-Za-z]{1,20})?)\b', re.IGNORECASE),
         ]
         
-        # Font patterns
+        # Font patterns. Bounded [A-Za-z ] runs instead of the
+        # ambiguous [A-Za-z\s]+ / \s* pairing, which backtracks heavily
+        # when the candidate span fails to terminate at a \b
         self.font_patterns = [
-            re.compile(r'\b(?:font|typeface|font family):\s*([A-Za-z\s]+(?:,\s*[A-Za-z\s]+)?)\b', re.IGNORECASE),
+            re.compile(r'\b(?:font|typeface|font family):\s*([A-Za-z ]{1,50}(?:,\s?[A-Za-z ]{1,50})?)\b', re.IGNORECASE),
             re.compile(r'\b(?:font size|font-size|text size):\s*(\d+(?:pt|px)?)\b', re.IGNORECASE),
         ]
         
@@ -93,10 +128,15 @@ class PatternMatcher:
             'innovative', 'trustworthy', 'luxury', 'affordable'
         ]
         
-        # Action item patterns
+        # Action item patterns. The bodies use a bounded negated class
+        # ([^.\n]{1,200}) rather than a lazy (.+?): when the trailing
+        # period is missing, the lazy form re-expands character by
+        # character at every start position (polynomial blowup on long
+        # period-free lines), while the negated class matches in one
+        # linear pass and cannot backtrack
         self.action_patterns = [
-            re.compile(r'\b(?:action|task|todo|to do|must|should|need to|required to):\s*(.+?)(?:\.|$)', re.IGNORECASE),
-            re.compile(r'[-•*]\s*(.+?)(?:\.|$)', re.MULTILINE),  # Bullet points
+            re.compile(r'\b(?:action|task|todo|to do|must|should|need to|required to):\s*([^.\n]{1,200})(?:\.|$)', re.IGNORECASE),
+            re.compile(r'[-•*]\s*([^.\n]{1,200})(?:\.|$)', re.MULTILINE),  # Bullet points
         ]
         
         # Warning/compliance keywords
@@ -105,6 +145,37 @@ class PatternMatcher:
             'legal requirement', 'regulatory', 'prohibited', 'not allowed',
             'violation', 'penalty', 'fine', 'restriction', 'mandatory'
         ]
+
+        # Sentence separator, shared by the warning extractors
+        self._sentence_split_re = re.compile(r'[.!?]\s+')
+        # Action-item cleanup patterns, hoisted out of the per-item loop
+        self._lead_bullet_re = re.compile(r'^\s*[-•*]\s*')
+        self._ws_re = re.compile(r'\s+')
+        # Tone context keywords as one alternation (see deadline_kw_re)
+        self._tone_ctx_re = re.compile(r'tone|voice|style|brand|guideline')
+
+        # Aho-Corasick automatons: scan the whole text once for every
+        # keyword simultaneously instead of one Python `in` check per
+        # keyword per sentence. Built once here; None when the optional
+        # dependency is missing
+        self._warning_ac = self._build_automaton(self.warning_keywords)
+        self._tone_ac = self._build_automaton(self.tone_keywords)
+        # List position of each warning keyword, so the automaton path
+        # reports the same keyword the list-order fallback scan would
+        self._warning_rank = {
+            keyword: rank for rank, keyword in enumerate(self.warning_keywords)
+        }
+
+    @staticmethod
+    def _build_automaton(keywords: List[str]):
+        """Build an Aho-Corasick automaton, or None without the library"""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
     
     def extract_technical_specs(self, text: str) -> Dict[str, Any]:
         """Extract technical specifications from text"""
@@ -114,101 +185,85 @@ class PatternMatcher:
             'file_sizes': []
         }
         
-        # Extract dimensions
-        dimension_matches = self.dimension_pattern.findall(text)
-        for match in dimension_matches:
-            width, height = match
-            specs['dimensions'].append(f"{width}x{height}")
-        
+        # Extract dimensions and file sizes in a single fused pass
+        for match in self._techspec_re.finditer(text):
+            if match.lastgroup == 'dim':
+                specs['dimensions'].append(f"{match.group('dim_w')}x{match.group('dim_h')}")
+            else:
+                specs['file_sizes'].append(
+                    f"{match.group('size_n')} {match.group('size_u').upper()}"
+                )
+
         # Extract formats
         format_matches = self.format_pattern.findall(text)
         specs['formats'].extend([f.upper() for f in format_matches])
-        
-        # Also look for common format mentions
-        common_formats = ['JPG', 'JPEG', 'PNG', 'PDF', 'MP4', 'MOV', 'GIF', 'SVG', 'WEBP']
-        text_upper = text.upper()
-        for fmt in common_formats:
-            if fmt in text_upper and fmt not in specs['formats']:
-                # Check if it's mentioned in context (not just random letters)
-                pattern = re.compile(rf'\b{fmt}\b', re.IGNORECASE)
-                if pattern.search(text):
-                    specs['formats'].append(fmt)
-        
-        # Extract file sizes
-        size_matches = self.file_size_pattern.findall(text)
-        for size, unit in size_matches:
-            specs['file_sizes'].append(f"{size} {unit.upper()}")
-        
+
+        # Also look for common format mentions (single pass; word
+        # boundaries in the pattern keep random letter runs out)
+        for fmt in self._common_fmt_re.findall(text):
+            fmt = fmt.upper()
+            if fmt not in specs['formats']:
+                specs['formats'].append(fmt)
+
         return specs
     
-    def extract_deadlines(self, text: str) -> List[Dict[str, str]]:
+    def extract_deadlines(self, text: str, text_lower: Optional[str] = None) -> List[Dict[str, str]]:
         """Extract deadlines and dates from text"""
         deadlines = []
-        
-        # Find all dates
-        all_dates = []
-        for pattern in self.date_patterns:
-            all_dates.extend(pattern.findall(text))
-        
-        # Find deadline context around dates
-        text_lower = text.lower()
-        for date_str in all_dates:
-            # Check if date is near deadline keywords
-            date_index = text.lower().find(date_str.lower())
-            if date_index != -1:
-                # Look for deadline keywords in surrounding context (100 chars)
-                context_start = max(0, date_index - 100)
-                context_end = min(len(text), date_index + len(date_str) + 100)
-                context = text_lower[context_start:context_end]
-                
-                is_deadline = any(keyword in context for keyword in self.deadline_keywords)
-                
-                if is_deadline or len(deadlines) == 0:  # Include first date even without keyword
-                    deadlines.append({
-                        'date': date_str,
-                        'type': 'deadline' if is_deadline else 'mentioned_date',
-                        'context': text[max(0, date_index - 50):date_index + len(date_str) + 50].strip()
-                    })
-        
+
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # Single pass: finditer reports each date's offset directly, so
+        # there is no O(N) str.find re-scan per date
+        for match in self.date_union.finditer(text):
+            date_str = match.group(0)
+            date_index = match.start()
+
+            # Look for deadline keywords in surrounding context (100 chars)
+            context_start = max(0, date_index - 100)
+            context_end = min(len(text), date_index + len(date_str) + 100)
+            context = text_lower[context_start:context_end]
+
+            is_deadline = self.deadline_kw_re.search(context) is not None
+
+            if is_deadline or len(deadlines) == 0:  # Include first date even without keyword
+                deadlines.append({
+                    'date': date_str,
+                    'type': 'deadline' if is_deadline else 'mentioned_date',
+                    'context': text[max(0, date_index - 50):date_index + len(date_str) + 50].strip()
+                })
+
         return deadlines
     
-    def extract_kpis(self, text: str) -> Dict[str, List[float]]:
-        """Extract KPIs and metrics from text"""
+    def extract_kpis(self, text: str, as_numpy: bool = False) -> Dict[str, Any]:
+        """
+        Extract KPIs and metrics from text
+
+        With as_numpy=True each value list is returned as a float64
+        ndarray instead, so consumers computing statistics over many
+        documents get SIMD reductions and unboxed storage. The default
+        stays list-based since the values are JSON-serialized as-is.
+        Requires numpy (optional, see requirements.txt).
+        """
         kpis = {}
-        
-        for pattern in self.kpi_patterns:
-            matches = pattern.findall(text)
-            if matches:
-                # Extract KPI name from pattern
-                pattern_str = pattern.pattern
-                if 'CTR' in pattern_str or 'Click-Through' in pattern_str:
-                    kpi_name = 'CTR'
-                elif 'CPC' in pattern_str or 'Cost Per Click' in pattern_str:
-                    kpi_name = 'CPC'
-                elif 'CPM' in pattern_str:
-                    kpi_name = 'CPM'
-                elif 'conversion' in pattern_str:
-                    kpi_name = 'conversion_rate'
-                elif 'ROAS' in pattern_str:
-                    kpi_name = 'ROAS'
-                elif 'CPA' in pattern_str:
-                    kpi_name = 'CPA'
-                elif 'impressions' in pattern_str:
-                    kpi_name = 'impressions'
-                elif 'clicks' in pattern_str:
-                    kpi_name = 'clicks'
-                else:
-                    kpi_name = 'unknown'
-                
-                # Convert to float and store
-                values = [float(m.replace(',', '')) for m in matches]
-                if kpi_name not in kpis:
-                    kpis[kpi_name] = []
-                kpis[kpi_name].extend(values)
-        
+
+        # One linear scan over the text; lastgroup names the outermost
+        # alternative that matched, i.e. the KPI itself
+        for match in self.kpi_union.finditer(text):
+            kpi_name = match.lastgroup
+            value = float(match.group(kpi_name + '_v').replace(',', ''))
+            if kpi_name not in kpis:
+                kpis[kpi_name] = []
+            kpis[kpi_name].append(value)
+
+        if as_numpy:
+            import numpy as np  # deferred: only stats consumers pay the import
+            kpis = {name: np.asarray(values, dtype=np.float64) for name, values in kpis.items()}
+
         return kpis
     
-    def extract_brand_guidelines(self, text: str) -> Dict[str, Any]:
+    def extract_brand_guidelines(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Extract brand guidelines (colors, fonts, tone) from text"""
         guidelines = {
             'colors': [],
@@ -239,23 +294,44 @@ class PatternMatcher:
             guidelines['fonts'].extend([f"{size}pt" for size in font_size_matches])
         
         # Extract tone
-        text_lower = text.lower()
-        for tone in self.tone_keywords:
-            if tone in text_lower:
-                # Check if it's in a brand/tone context
-                tone_index = text_lower.find(tone)
-                if tone_index != -1:
-                    context = text[max(0, tone_index - 30):tone_index + len(tone) + 30].lower()
-                    if any(keyword in context for keyword in ['tone', 'voice', 'style', 'brand', 'guideline']):
-                        if tone not in guidelines['tone']:
-                            guidelines['tone'].append(tone)
-        
+        if text_lower is None:
+            text_lower = text.lower()
+        if self._tone_ac is not None:
+            # One automaton pass finds every tone keyword occurrence.
+            # Only the first occurrence of each keyword is context-checked
+            # and accepted keywords are emitted in keyword-list order, so
+            # the output matches the str.find fallback below exactly
+            processed = set()
+            accepted = set()
+            for end_index, tone in self._tone_ac.iter(text_lower):
+                if tone in processed:
+                    continue
+                processed.add(tone)
+                tone_index = end_index - len(tone) + 1
+                context = text_lower[max(0, tone_index - 30):end_index + 31]
+                if self._tone_ctx_re.search(context):
+                    accepted.add(tone)
+            if accepted:
+                guidelines['tone'].extend(
+                    tone for tone in self.tone_keywords if tone in accepted
+                )
+        else:
+            for tone in self.tone_keywords:
+                if tone in text_lower:
+                    # Check if it's in a brand/tone context
+                    tone_index = text_lower.find(tone)
+                    if tone_index != -1:
+                        context = text_lower[max(0, tone_index - 30):tone_index + len(tone) + 30]
+                        if self._tone_ctx_re.search(context):
+                            if tone not in guidelines['tone']:
+                                guidelines['tone'].append(tone)
+
         return guidelines
     
     def extract_action_items(self, text: str) -> List[str]:
         """Extract action items and tasks from text"""
-        action_items = []
-        
+        candidates = []
+
         # Use action patterns
         for pattern in self.action_patterns:
             matches = pattern.findall(text)
@@ -263,20 +339,64 @@ class PatternMatcher:
                 item = match.strip() if isinstance(match, str) else match[0].strip() if match else ""
                 if item and len(item) > 10 and len(item) < 200:  # Reasonable length
                     # Clean up the item
-                    item = re.sub(r'^\s*[-•*]\s*', '', item)  # Remove leading bullets
-                    item = re.sub(r'\s+', ' ', item)  # Normalize whitespace
-                    if item not in action_items:
-                        action_items.append(item)
-        
-        return action_items[:20]  # Limit to 20 items
+                    item = self._lead_bullet_re.sub('', item)  # Remove leading bullets
+                    item = self._ws_re.sub(' ', item)  # Normalize whitespace
+                    candidates.append(item)
+
+        # dict.fromkeys: order-preserving dedup in O(K) instead of a
+        # `not in list` membership test per candidate (O(K^2))
+        return list(dict.fromkeys(candidates))[:20]  # Limit to 20 items
     
-    def extract_warnings(self, text: str) -> List[Dict[str, str]]:
+    def extract_warnings(self, text: str, text_lower: Optional[str] = None) -> List[Dict[str, str]]:
         """Extract warnings and compliance issues from text"""
         warnings = []
-        
-        text_lower = text.lower()
-        sentences = re.split(r'[.!?]\s+', text)
-        
+
+        if text_lower is None:
+            text_lower = text.lower()
+
+        if self._warning_ac is not None:
+            # Single automaton pass over the text; each hit is mapped
+            # back to its sentence through the sentence start offsets.
+            # Sentence spans mirror _sentence_split_re.split exactly:
+            # each separator match ends one sentence (punctuation and
+            # whitespace consumed) and the tail after the last separator
+            # keeps its trailing punctuation, just like re.split
+            hits = list(self._warning_ac.iter(text_lower))
+            if not hits:
+                return warnings
+
+            sentence_starts = [0]
+            sentence_spans = []
+            previous_end = 0
+            for separator in self._sentence_split_re.finditer(text):
+                sentence_spans.append((previous_end, separator.start()))
+                previous_end = separator.end()
+                sentence_starts.append(previous_end)
+            sentence_spans.append((previous_end, len(text)))
+
+            flagged: Dict[int, str] = {}
+            for end_index, keyword in hits:
+                start_index = end_index - len(keyword) + 1
+                sentence_idx = bisect_right(sentence_starts, start_index) - 1
+                current = flagged.get(sentence_idx)
+                # Keep the keyword the fallback would report: the first
+                # one in warning_keywords order, not the leftmost hit
+                if current is None or self._warning_rank[keyword] < self._warning_rank[current]:
+                    flagged[sentence_idx] = keyword
+
+            for sentence_idx in sorted(flagged):
+                span_start, span_end = sentence_spans[sentence_idx]
+                sentence = text[span_start:span_end]
+                sentence_lower = text_lower[span_start:span_end]
+                warnings.append({
+                    'type': 'compliance' if 'compliance' in sentence_lower or 'legal' in sentence_lower else 'warning',
+                    'text': sentence.strip(),
+                    'keyword': flagged[sentence_idx]
+                })
+            return warnings
+
+        sentences = self._sentence_split_re.split(text)
+
         for sentence in sentences:
             sentence_lower = sentence.lower()
             # Check if sentence contains warning keywords
@@ -288,17 +408,48 @@ class PatternMatcher:
                         'keyword': keyword
                     })
                     break  # Only add once per sentence
-        
+
         return warnings
     
-    def extract_all(self, text: str) -> Dict[str, Any]:
+    def extract_all(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Extract all structured data from text"""
+        # Lowercase once and share across the sub-extractors instead of
+        # each one re-copying the full text
+        if text_lower is None:
+            text_lower = text.lower()
         return {
             'technical_specs': self.extract_technical_specs(text),
-            'deadlines': self.extract_deadlines(text),
+            'deadlines': self.extract_deadlines(text, text_lower),
             'kpis': self.extract_kpis(text),
-            'brand_guidelines': self.extract_brand_guidelines(text),
+            'brand_guidelines': self.extract_brand_guidelines(text, text_lower),
             'action_items': self.extract_action_items(text),
-            'warnings': self.extract_warnings(text)
+            'warnings': self.extract_warnings(text, text_lower)
         }
 
+    def extract_all_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract structured data from several documents concurrently
+
+        All matcher state is read-only after __init__, so the threads
+        share the compiled patterns without locking; the regex engine
+        does its matching in C, so threads overlap usefully even under
+        the GIL. Results come back in input order.
+        """
+        if len(texts) <= 1:
+            return [self.extract_all(t) for t in texts]
+        workers = min(len(texts), os.cpu_count() or 2)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract_all, texts))
+
+
+@lru_cache(maxsize=1)
+def get_matcher() -> PatternMatcher:
+    """
+    Return the process-wide PatternMatcher instance, built lazily
+
+    Constructing a matcher compiles ~20 regexes; callers that would
+    otherwise instantiate one per request should go through this
+    accessor so compilation is paid once per process.
+    """
+    return PatternMatcher()
+
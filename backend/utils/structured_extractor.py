@@ -3,10 +3,115 @@ Structured extraction utilities for creating organized, deduplicated output
 """
 import re
 import logging
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Optional
+
+try:
+    # Optional: single-pass multi-keyword scanning (pip install pyahocorasick)
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# All patterns are compiled once at import and bound to module constants;
+# calling .search on the compiled object also skips the re module's
+# internal cache lookup that the string-pattern forms pay on every call
+_PRODUCT_RES = [
+    re.compile(r'launch\s+([A-Z][A-Za-z\s]+?)(?:\s+(?:at|in|on|via)|[.,;])', re.IGNORECASE),
+    re.compile(r'campaign\s+for\s+([A-Z][A-Za-z\s]+?)(?:\s+(?:at|in|on)|[.,;])', re.IGNORECASE),
+    re.compile(r'promote\s+([A-Z][A-Za-z\s]+?)(?:\s+(?:at|in|on)|[.,;])', re.IGNORECASE),
+]
+_RETAILER_RES = [
+    re.compile(r'at\s+([A-Z][A-Za-z]+)', re.IGNORECASE),
+    re.compile(r'via\s+([A-Z][A-Za-z]+)', re.IGNORECASE),
+    re.compile(r'([A-Z][A-Za-z]+)\s+website', re.IGNORECASE),
+]
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]\s+')
+_FALLBACK_DATE_RE = re.compile(
+    r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4}[/-]\d{1,2}[/-]\d{1,2}|(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})\b',
+    re.IGNORECASE
+)
+_CHANNEL_RE = re.compile(
+    r'(?:channel|placement|format)[\s:]+([A-Za-z\s]+(?:onsite|checkout|display|social|video|email|mobile|desktop)[A-Za-z\s]*)',
+    re.IGNORECASE
+)
+_BRAND_LOGO_RE = re.compile(r'([A-Z][A-Za-z]+)\s+logo', re.IGNORECASE)
+_QUANTITY_MAX_RE = re.compile(r'(\d+)\s*(?:flavours?|variants?|products?)\s*(?:max|maximum)')
+# Tag requirement probes folded into one alternation: a single scan
+# over the text instead of three
+_TAG_RE = re.compile(r"tesco['\s]+(?:tag|branding)|only at tesco|must include tesco")
+_PLACEMENT_RES = [
+    (re.compile(r'onsite[\s\w]*brand[\s\w]*desktop'), 'Onsite Brand – Desktop'),
+    (re.compile(r'onsite[\s\w]*brand[\s\w]*mobile'), 'Onsite Brand – Mobile'),
+    (re.compile(r'checkout[\s\w]*double[\s\w]*density'), 'Checkout Double Density'),
+    (re.compile(r'checkout[\s\w]*single[\s\w]*density'), 'Checkout Single Density'),
+    (re.compile(r'display[\s\w]*banner'), 'Display Banner'),
+    (re.compile(r'social[\s\w]*banner'), 'Social Banner'),
+]
+
+
+# Keyword groups scanned per request. With pyahocorasick available each
+# group compiles to one automaton and the whole text is swept once for
+# all keywords together; otherwise the substring loops below are used
+_CHANNEL_KEYWORDS = {
+    'Tesco onsite brand formats': ['onsite brand', 'site brand', 'brand formats'],
+    'Checkout placements': ['checkout', 'checkout double density', 'checkout single density'],
+    'Social banners': ['social banner', 'social media banner', 'social ad'],
+    'Display ads': ['display ad', 'display advertising', 'banner ad'],
+    'Video ads': ['video ad', 'video creative', 'video format'],
+    'Email campaigns': ['email campaign', 'email creative', 'email ad'],
+    'In-store POS': ['point of sale', 'pos', 'in-store', 'in store display'],
+    'Mobile ads': ['mobile ad', 'mobile banner', 'mobile creative'],
+    'Desktop ads': ['desktop ad', 'desktop banner', 'desktop creative'],
+}
+_DONT_KEYWORDS = {
+    'prices': ['no price', 'no pricing', 'avoid price', "don't mention price"],
+    'discounts': ['no discount', 'no offer', 'avoid discount'],
+    'competitions': ['no competition', 'no prize', 'no giveaway'],
+    'health/sustainability claims': ['no health claim', 'no sustainability', 'no environmental claim'],
+    'T&Cs': ['no t&cs', 'no terms and conditions'],
+}
+
+
+def _build_keyword_automaton(mapping: Dict[str, List[str]]):
+    """Compile a name->keywords mapping into an automaton, or None"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for name, keywords in mapping.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, name)
+    automaton.make_automaton()
+    return automaton
+
+
+_CHANNEL_AC = _build_keyword_automaton(_CHANNEL_KEYWORDS)
+_DONT_AC = _build_keyword_automaton(_DONT_KEYWORDS)
+
+# Pre-bound KPI formatters: f-string lambdas avoid re-parsing a
+# str.format template (and the title-casing fallback) per KPI
+# Warning-categorization vocabularies as compiled alternations: one
+# C-level scan of each warning text per category instead of a Python
+# loop of substring probes. Substring semantics are kept on purpose —
+# several entries are stems ('condition' must hit 'conditions')
+_COPY_WORDS_RE = re.compile(r't&c|terms|condition|competition|charity|sustainability')
+_DESIGN_WORDS_RE = re.compile(r'overlap|tag|tile|background|design|layout')
+_ACCESS_WORDS_RE = re.compile(r'font|contrast|accessibility|wcag|readable')
+_LEGAL_WORDS_RE = re.compile(r'legal|claim|guarantee|alcohol|regulatory|compliance')
+
+_SEASONS = ('summer', 'winter', 'spring', 'autumn')
+
+_KPI_FORMATTERS = {
+    'CTR': lambda v: f'CTR target: {v}%',
+    'conversion_rate': lambda v: f'Conversion rate: {v}%',
+    'CPC': lambda v: f'CPC target: £{v}',
+    'CPM': lambda v: f'CPM target: £{v}',
+    'ROAS': lambda v: f'ROAS target: {v}',
+    'CPA': lambda v: f'CPA target: £{v}',
+    'impressions': lambda v: f'Impressions target: {v}',
+    'clicks': lambda v: f'Clicks target: {v}',
+}
+
 
 def deduplicate_list(items: List[str]) -> List[str]:
     """
@@ -18,17 +123,17 @@ def deduplicate_list(items: List[str]) -> List[str]:
     Returns:
         Deduplicated list preserving original case of first occurrence
     """
-    seen: Set[str] = set()
-    result = []
+    # Insertion-ordered dict keyed on the normalized form: one strip per
+    # item, and the dedup itself runs inside the dict C implementation
+    seen: Dict[str, str] = {}
     for item in items:
-        normalized = item.strip().lower()
-        if normalized and normalized not in seen:
-            seen.add(normalized)
-            result.append(item.strip())
-    return result
+        stripped = item.strip()
+        if stripped:
+            seen.setdefault(stripped.lower(), stripped)
+    return list(seen.values())
 
 
-def extract_goal(text: str) -> str:
+def extract_goal(text: str, text_lower: Optional[str] = None) -> str:
     """
     Extract a short, tweet-level goal statement (2-3 lines max)
     
@@ -39,21 +144,15 @@ def extract_goal(text: str) -> str:
         One simple sentence describing the campaign/document goal
     """
     # Look for campaign launch/objective in first 1500 chars
-    text_sample = text[:1500].lower()
+    text_sample = (text_lower or text.lower())[:1500]
     
     # Try to extract key action + product + retailer + objective
     goal_parts = []
-    
+
     # Find product/brand name
-    product_patterns = [
-        r'launch\s+([A-Z][A-Za-z\s]+?)(?:\s+(?:at|in|on|via)|[.,;])',
-        r'campaign\s+for\s+([A-Z][A-Za-z\s]+?)(?:\s+(?:at|in|on)|[.,;])',
-        r'promote\s+([A-Z][A-Za-z\s]+?)(?:\s+(?:at|in|on)|[.,;])',
-    ]
-    
     product = None
-    for pattern in product_patterns:
-        match = re.search(pattern, text[:2000], re.IGNORECASE)
+    for pattern in _PRODUCT_RES:
+        match = pattern.search(text, 0, 2000)
         if match:
             product = match.group(1).strip()
             # Limit product name length
@@ -63,10 +162,9 @@ def extract_goal(text: str) -> str:
             break
     
     # Find retailer/channel
-    retailer_patterns = [r'at\s+([A-Z][A-Za-z]+)', r'via\s+([A-Z][A-Za-z]+)', r'([A-Z][A-Za-z]+)\s+website']
     retailer = None
-    for pattern in retailer_patterns:
-        match = re.search(pattern, text[:2000], re.IGNORECASE)
+    for pattern in _RETAILER_RES:
+        match = pattern.search(text, 0, 2000)
         if match:
             retailer = match.group(1).strip()
             break
@@ -84,29 +182,40 @@ def extract_goal(text: str) -> str:
         goal = f"Launch {product} at {retailer}"
         if objective:
             goal += f", building {objective}"
-        # Add timing if available
-        if 'summer' in text_sample or 'winter' in text_sample or 'spring' in text_sample or 'autumn' in text_sample:
-            seasons = ['summer', 'winter', 'spring', 'autumn']
-            for season in seasons:
-                if season in text_sample:
-                    goal += f" during {season}"
-                    break
+        # Add timing if available (one scan per season, not two)
+        season = next((s for s in _SEASONS if s in text_sample), None)
+        if season:
+            goal += f" during {season}"
         goal += "."
     else:
-        # Fallback: use first meaningful sentence (max 150 chars)
-        sentences = re.split(r'[.!?]\s+', text)
-        for sentence in sentences[:3]:
-            sentence = sentence.strip()
+        # Fallback: use first meaningful sentence (max 150 chars).
+        # Walk the boundaries lazily and stop after three candidates
+        # instead of splitting the whole document into a sentence list
+        goal = None
+        candidates = 0
+        previous_end = 0
+        for boundary in _SENTENCE_SPLIT_RE.finditer(text):
+            sentence = text[previous_end:boundary.start()].strip()
+            previous_end = boundary.end()
+            candidates += 1
             if len(sentence) > 30 and len(sentence) < 150:
                 goal = sentence[:147] + ('...' if len(sentence) > 147 else '.')
                 break
+            if candidates >= 3:
+                break
         else:
+            # Fewer than 3 boundaries: the trailing text is a candidate too
+            if candidates < 3:
+                sentence = text[previous_end:].strip()
+                if len(sentence) > 30 and len(sentence) < 150:
+                    goal = sentence[:147] + ('...' if len(sentence) > 147 else '.')
+        if goal is None:
             goal = text[:147].strip() + ('...' if len(text) > 147 else '.')
     
     return goal
 
 
-def extract_structured_dates(text: str, deadlines: List[Dict[str, str]]) -> List[str]:
+def extract_structured_dates(text: str, deadlines: List[Dict[str, str]], text_lower: Optional[str] = None) -> List[str]:
     """
     Extract and format dates into structured list
     
@@ -118,7 +227,8 @@ def extract_structured_dates(text: str, deadlines: List[Dict[str, str]]) -> List
         List of formatted date strings (e.g., "start: DD/MM/YYYY")
     """
     dates = []
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     
     # Map deadline types
     for deadline in deadlines[:5]:  # Limit to 5 dates
@@ -147,15 +257,14 @@ def extract_structured_dates(text: str, deadlines: List[Dict[str, str]]) -> List
     
     # If no dates found, try to find dates in text
     if not dates:
-        date_pattern = re.compile(r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4}[/-]\d{1,2}[/-]\d{1,2}|(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})\b', re.IGNORECASE)
-        found_dates = date_pattern.findall(text[:2000])
+        found_dates = _FALLBACK_DATE_RE.findall(text, 0, 2000)
         if found_dates:
             dates.append(f"mentioned_date: {found_dates[0]}")
     
     return deduplicate_list(dates)
 
 
-def extract_channels(text: str) -> List[str]:
+def extract_channels(text: str, text_lower: Optional[str] = None) -> List[str]:
     """
     Extract channel/placement information from document
     
@@ -166,28 +275,21 @@ def extract_channels(text: str) -> List[str]:
         List of channel/placement names
     """
     channels = []
-    text_lower = text.lower()
-    
-    # Common retail media channels
-    channel_keywords = {
-        'Tesco onsite brand formats': ['onsite brand', 'site brand', 'brand formats'],
-        'Checkout placements': ['checkout', 'checkout double density', 'checkout single density'],
-        'Social banners': ['social banner', 'social media banner', 'social ad'],
-        'Display ads': ['display ad', 'display advertising', 'banner ad'],
-        'Video ads': ['video ad', 'video creative', 'video format'],
-        'Email campaigns': ['email campaign', 'email creative', 'email ad'],
-        'In-store POS': ['point of sale', 'pos', 'in-store', 'in store display'],
-        'Mobile ads': ['mobile ad', 'mobile banner', 'mobile creative'],
-        'Desktop ads': ['desktop ad', 'desktop banner', 'desktop creative'],
-    }
-    
-    for channel_name, keywords in channel_keywords.items():
-        if any(keyword in text_lower for keyword in keywords):
-            channels.append(channel_name)
+    if text_lower is None:
+        text_lower = text.lower()
+    
+    # Common retail media channels, matched in one automaton sweep when
+    # available (see _CHANNEL_KEYWORDS)
+    if _CHANNEL_AC is not None:
+        hits = {name for _, name in _CHANNEL_AC.iter(text_lower)}
+        channels.extend(name for name in _CHANNEL_KEYWORDS if name in hits)
+    else:
+        for channel_name, keywords in _CHANNEL_KEYWORDS.items():
+            if any(keyword in text_lower for keyword in keywords):
+                channels.append(channel_name)
     
     # Also look for explicit channel mentions
-    channel_pattern = re.compile(r'(?:channel|placement|format)[\s:]+([A-Za-z\s]+(?:onsite|checkout|display|social|video|email|mobile|desktop)[A-Za-z\s]*)', re.IGNORECASE)
-    matches = channel_pattern.findall(text[:3000])
+    matches = _CHANNEL_RE.findall(text, 0, 3000)
     for match in matches:
         channel = match.strip()
         if len(channel) < 100 and channel not in channels:
@@ -208,29 +310,21 @@ def extract_primary_kpis(text: str, kpis: Dict[str, List[float]]) -> List[str]:
         List of formatted KPI strings
     """
     kpi_list = []
-    
-    # Format KPIs from dictionary
-    kpi_formats = {
-        'CTR': 'CTR target: {value}%',
-        'conversion_rate': 'Conversion rate: {value}%',
-        'CPC': 'CPC target: £{value}',
-        'CPM': 'CPM target: £{value}',
-        'ROAS': 'ROAS target: {value}',
-        'CPA': 'CPA target: £{value}',
-        'impressions': 'Impressions target: {value}',
-        'clicks': 'Clicks target: {value}',
-    }
-    
+
+    # Format KPIs from dictionary (first value per KPI)
     for kpi_name, values in kpis.items():
         if values:
-            value = values[0]  # Take first value
-            format_str = kpi_formats.get(kpi_name, '{kpi_name}: {value}')
-            kpi_list.append(format_str.format(kpi_name=kpi_name.replace('_', ' ').title(), value=value))
-    
-    return deduplicate_list(kpi_list)
+            formatter = _KPI_FORMATTERS.get(kpi_name)
+            if formatter is not None:
+                kpi_list.append(formatter(values[0]))
+            else:
+                kpi_list.append(f"{kpi_name.replace('_', ' ').title()}: {values[0]}")
+
+    # Unique by construction: one formatted entry per KPI dict key
+    return kpi_list
 
 
-def extract_must_include(text: str, brand_guidelines: Dict[str, Any]) -> str:
+def extract_must_include(text: str, brand_guidelines: Dict[str, Any], text_lower: Optional[str] = None) -> str:
     """
     Extract must-include elements as a single line
     
@@ -242,12 +336,13 @@ def extract_must_include(text: str, brand_guidelines: Dict[str, Any]) -> str:
         Single line string (e.g., "CrunchJoy logo + packshots (3 flavours max) + Tesco 'Only at Tesco' tag.")
     """
     elements = []
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     
     # Find logo requirement
     if 'logo' in text_lower:
         # Try to find brand name
-        brand_match = re.search(r'([A-Z][A-Za-z]+)\s+logo', text[:1000], re.IGNORECASE)
+        brand_match = _BRAND_LOGO_RE.search(text, 0, 1000)
         if brand_match:
             elements.append(f"{brand_match.group(1)} logo")
         else:
@@ -256,22 +351,15 @@ def extract_must_include(text: str, brand_guidelines: Dict[str, Any]) -> str:
     # Find packshot requirement
     if 'packshot' in text_lower:
         # Check for quantity limit
-        quantity_match = re.search(r'(\d+)\s*(?:flavours?|variants?|products?)\s*(?:max|maximum)', text_lower)
+        quantity_match = _QUANTITY_MAX_RE.search(text_lower)
         if quantity_match:
             elements.append(f"packshots ({quantity_match.group(1)} max)")
         else:
             elements.append("packshots")
     
     # Find tag requirement
-    tag_patterns = [
-        r"tesco['\s]+(?:tag|branding)",
-        r"only at tesco",
-        r"must include tesco",
-    ]
-    for pattern in tag_patterns:
-        if re.search(pattern, text_lower):
-            elements.append("Tesco 'Only at Tesco' tag")
-            break
+    if _TAG_RE.search(text_lower):
+        elements.append("Tesco 'Only at Tesco' tag")
     
     if elements:
         result = " + ".join(elements) + "."
@@ -281,7 +369,7 @@ def extract_must_include(text: str, brand_guidelines: Dict[str, Any]) -> str:
     return result
 
 
-def extract_biggest_donts(text: str, warnings: List[Dict[str, str]]) -> str:
+def extract_biggest_donts(text: str, warnings: List[Dict[str, str]], text_lower: Optional[str] = None) -> str:
     """
     Extract biggest 'don'ts' as a single line
     
@@ -293,23 +381,26 @@ def extract_biggest_donts(text: str, warnings: List[Dict[str, str]]) -> str:
         Single line string (e.g., "Don't mention prices, discounts, competitions, or health/sustainability claims.")
     """
     donts = []
-    text_lower = text.lower()
-    
-    # Common don'ts
-    dont_keywords = {
-        'prices': ['no price', 'no pricing', 'avoid price', "don't mention price"],
-        'discounts': ['no discount', 'no offer', 'avoid discount'],
-        'competitions': ['no competition', 'no prize', 'no giveaway'],
-        'health/sustainability claims': ['no health claim', 'no sustainability', 'no environmental claim'],
-        'T&Cs': ['no t&cs', 'no terms and conditions'],
-    }
-    
-    for dont_name, keywords in dont_keywords.items():
-        if any(keyword in text_lower for keyword in keywords):
-            donts.append(dont_name)
-    
-    # Limit to 4-5 items
-    donts = donts[:4]
+    if text_lower is None:
+        text_lower = text.lower()
+    
+    # Common don'ts, matched in one automaton sweep when available.
+    # Stop at 4 categories — that is all the output line reports, so
+    # later categories (and their scans, on the fallback path) can be
+    # skipped once the quota is filled
+    if _DONT_AC is not None:
+        hits = {name for _, name in _DONT_AC.iter(text_lower)}
+        for name in _DONT_KEYWORDS:
+            if name in hits:
+                donts.append(name)
+                if len(donts) >= 4:
+                    break
+    else:
+        for dont_name, keywords in _DONT_KEYWORDS.items():
+            if any(keyword in text_lower for keyword in keywords):
+                donts.append(dont_name)
+                if len(donts) >= 4:
+                    break
     
     if donts:
         result = "Don't mention " + ", ".join(donts) + "."
@@ -322,7 +413,8 @@ def extract_biggest_donts(text: str, warnings: List[Dict[str, str]]) -> str:
 def categorize_creative_requirements(
     technical_specs: Dict[str, Any],
     brand_guidelines: Dict[str, Any],
-    text: str
+    text: str,
+    text_lower: Optional[str] = None
 ) -> Dict[str, List[str]]:
     """
     Categorize creative requirements into must_have and optional
@@ -337,7 +429,8 @@ def categorize_creative_requirements(
     """
     must_have = []
     optional = []
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     
     # Must-have: Logo, mandatory tags, required elements
     if 'logo' in text_lower or 'brand logo' in text_lower:
@@ -360,13 +453,15 @@ def categorize_creative_requirements(
         formats = ', '.join(technical_specs['formats'][:3])
         must_have.append(f'Use file formats: {formats}')
     
+    # Each entry comes from a distinct literal branch, so the lists are
+    # unique by construction and need no dedup pass
     return {
-        'must_have': deduplicate_list(must_have),
-        'optional': deduplicate_list(optional)
+        'must_have': must_have,
+        'optional': optional
     }
 
 
-def structure_technical_specs(technical_specs: Dict[str, Any], text: str) -> List[Dict[str, Any]]:
+def structure_technical_specs(technical_specs: Dict[str, Any], text: str, text_lower: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Structure technical specifications as array of placement objects
     
@@ -378,31 +473,23 @@ def structure_technical_specs(technical_specs: Dict[str, Any], text: str) -> Lis
         List of placement specification objects
     """
     placements = []
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     
     # Extract dimensions
     dimensions = technical_specs.get('dimensions', [])
     formats = technical_specs.get('formats', [])
     
-    # Try to match dimensions with placements
-    placement_patterns = [
-        (r'onsite[\s\w]*brand[\s\w]*desktop', 'Onsite Brand – Desktop'),
-        (r'onsite[\s\w]*brand[\s\w]*mobile', 'Onsite Brand – Mobile'),
-        (r'checkout[\s\w]*double[\s\w]*density', 'Checkout Double Density'),
-        (r'checkout[\s\w]*single[\s\w]*density', 'Checkout Single Density'),
-        (r'display[\s\w]*banner', 'Display Banner'),
-        (r'social[\s\w]*banner', 'Social Banner'),
-    ]
-    
+    # Resolve the placement name once — the scan result is the same for
+    # every dimension, so there is no need to repeat it per placement
+    placement_name = 'Creative Placement'
+    for pattern, name in _PLACEMENT_RES:
+        if pattern.search(text_lower):
+            placement_name = name
+            break
+
     # Create placements for each dimension
     for dim in dimensions[:5]:  # Limit to 5 placements
-        placement_name = 'Creative Placement'
-        # Try to find matching placement name
-        for pattern, name in placement_patterns:
-            if re.search(pattern, text_lower):
-                placement_name = name
-                break
-        
         placement = {
             'placement': placement_name,
             'size': dim if 'x' in dim else f'{dim} px',
@@ -432,7 +519,7 @@ def structure_technical_specs(technical_specs: Dict[str, Any], text: str) -> Lis
     return placements
 
 
-def categorize_guidelines(warnings: List[Dict[str, str]], text: str) -> Dict[str, List[str]]:
+def categorize_guidelines(warnings: List[Dict[str, str]], text: str, text_lower: Optional[str] = None) -> Dict[str, List[str]]:
     """
     Categorize guidelines/warnings into rule categories
     
@@ -443,7 +530,8 @@ def categorize_guidelines(warnings: List[Dict[str, str]], text: str) -> Dict[str
     Returns:
         Dict with categorized rule lists
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     
     copy_rules = []
     design_rules = []
@@ -487,16 +575,16 @@ def categorize_guidelines(warnings: List[Dict[str, str]], text: str) -> Dict[str
             continue
         
         # Categorize based on content
-        if any(word in warning_text for word in ['t&c', 'terms', 'condition', 'competition', 'charity', 'sustainability']):
+        if _COPY_WORDS_RE.search(warning_text):
             if clean_warning not in copy_rules:
                 copy_rules.append(clean_warning[:150])
-        elif any(word in warning_text for word in ['overlap', 'tag', 'tile', 'background', 'design', 'layout']):
+        elif _DESIGN_WORDS_RE.search(warning_text):
             if clean_warning not in design_rules:
                 design_rules.append(clean_warning[:150])
-        elif any(word in warning_text for word in ['font', 'contrast', 'accessibility', 'wcag', 'readable']):
+        elif _ACCESS_WORDS_RE.search(warning_text):
             if clean_warning not in accessibility_rules:
                 accessibility_rules.append(clean_warning[:150])
-        elif any(word in warning_text for word in ['legal', 'claim', 'guarantee', 'alcohol', 'regulatory', 'compliance']):
+        elif _LEGAL_WORDS_RE.search(warning_text):
             if clean_warning not in legal_rules:
                 legal_rules.append(clean_warning[:150])
         else:
@@ -516,7 +604,8 @@ def create_action_items(
     deadlines: List[Dict[str, str]],
     technical_specs: Dict[str, Any],
     warnings: List[Dict[str, str]],
-    text: str
+    text: str,
+    text_lower: Optional[str] = None
 ) -> List[str]:
     """
     Create imperative action items from extracted data (max 5 items, each ≤ 1 sentence)
@@ -531,7 +620,8 @@ def create_action_items(
         List of imperative action item strings (max 5)
     """
     action_items = []
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     
     # Add deadline-based actions (limit 1)
     for deadline in deadlines[:1]:
@@ -561,5 +651,8 @@ def create_action_items(
     elif 't&c' in text_lower or 'terms and conditions' in text_lower:
         action_items.append("Avoid any T&Cs, competition, or sustainability text in creative.")
     
+    # Normalized-key dedup: warning-derived items are raw document
+    # slices that may carry trailing whitespace, so they need the
+    # per-item strip that deduplicate_list applies
     return deduplicate_list(action_items)[:5]  # Limit to 5 items
 
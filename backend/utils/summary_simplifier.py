@@ -2,7 +2,77 @@
 Simplified summary extraction - creates tweet-level summaries
 """
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+try:
+    # Optional: single-pass multi-keyword scanning (pip install pyahocorasick)
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Compiled once at import; the date patterns are reused on every request.
+# Dash normalization goes through str.translate — a straight C table
+# lookup per character, cheaper than a regex substitution
+_DASH_TABLE = str.maketrans('–—', '--')
+_DATE_RANGE_RE = re.compile(
+    r'\b(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})\s*[–—-]\s*(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})\b',
+    re.IGNORECASE
+)
+_ASSET_DEADLINE_RE = re.compile(
+    r'(?:asset\s+delivery\s+deadline|assets\s+due|deliver.*?by|deadline.*?deliver).*?(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
+    re.IGNORECASE | re.DOTALL
+)
+_DASH_SPLIT_RE = re.compile(r'[–-]')
+
+# Month abbreviation: one regex substitution instead of 24 str.replace
+# scans (two per month) per formatted date
+_MONTH_MAP = {
+    'January': 'Jan', 'February': 'Feb', 'March': 'Mar', 'April': 'Apr',
+    'May': 'May', 'June': 'Jun', 'July': 'Jul', 'August': 'Aug',
+    'September': 'Sep', 'October': 'Oct', 'November': 'Nov', 'December': 'Dec'
+}
+_MONTH_RE = re.compile('|'.join(_MONTH_MAP), re.IGNORECASE)
+
+
+def _abbreviate_month(match: 're.Match') -> str:
+    month = match.group(0)
+    short = _MONTH_MAP[month.title()]
+    return short.lower() if month.islower() else short
+
+# Channel keywords, swept in one automaton pass when available
+_CHANNEL_MAP = {
+    'Tesco website banners': ['website', 'onsite', 'site brand'],
+    'Checkout ads': ['checkout'],
+    'Instagram/Facebook Stories': ['instagram', 'facebook', 'stories'],
+    'Display ads': ['display', 'banner'],
+    'Email campaigns': ['email'],
+}
+
+
+def _build_channel_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for name, keywords in _CHANNEL_MAP.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, name)
+    automaton.make_automaton()
+    return automaton
+
+
+_CHANNEL_AC = _build_channel_automaton()
+
+# KPI priority order and pre-bound formatters for the targets line;
+# replaces an if/elif chain evaluated inside the loop. ROAS stays in
+# the priority list without a formatter, matching the old behavior of
+# recognizing it but not printing it
+_KPI_PRIORITY = ('CTR', 'conversion_rate', 'sales_uplift', 'add-to-basket', 'ROAS')
+_SIMPLE_KPI_FORMATTERS = {
+    'CTR': lambda v: f'CTR ≥ {v}%',
+    'conversion_rate': lambda v: f'conversion ≥ {v}%',
+    'sales_uplift': lambda v: f'+{v}% sales uplift',
+    'add-to-basket': lambda v: f'add-to-basket ≥ {v}%',
+}
 
 def extract_simple_dates(text: str, deadlines: List[Dict[str, str]]) -> str:
     """Extract dates as single line: "10 Jun – 31 Jul 2026 (assets due 27 May)." """
@@ -10,9 +80,9 @@ def extract_simple_dates(text: str, deadlines: List[Dict[str, str]]) -> str:
     end_date = None
     asset_deadline = None
     
-    # Normalize text: replace various dash types with standard dash, normalize whitespace
-    text_normalized = re.sub(r'[–—]', '-', text)  # Replace em/en dashes with hyphen
-    text_normalized = re.sub(r'\s+', ' ', text_normalized)  # Normalize whitespace
+    # Normalize dashes only; the date patterns match runs of whitespace
+    # with \s+ themselves, so no full-text whitespace rewrite is needed
+    text_normalized = text.translate(_DASH_TABLE)
     
     # First, try to extract from deadlines list
     for deadline in deadlines[:10]:  # Check more deadlines
@@ -20,11 +90,11 @@ def extract_simple_dates(text: str, deadlines: List[Dict[str, str]]) -> str:
         context = deadline.get('context', '').lower()
         
         # Normalize date string
-        date_str = re.sub(r'[–—]', '-', date_str)
+        date_str = date_str.translate(_DASH_TABLE)
         
         # Check for date ranges (e.g., "10 June 2026 – 31 July 2026" or "10 June 2026 - 31 July 2026")
         if '–' in date_str or '-' in date_str:
-            parts = re.split(r'[–-]', date_str, 1)
+            parts = _DASH_SPLIT_RE.split(date_str, 1)
             if len(parts) == 2:
                 if not start_date:
                     start_date = parts[0].strip()
@@ -47,22 +117,14 @@ def extract_simple_dates(text: str, deadlines: List[Dict[str, str]]) -> str:
     if not start_date and not end_date:
         # Look for date range patterns like "10 June 2026 – 31 July 2026" or "10 June 2026 - 31 July 2026"
         # Support both hyphen and various dash types
-        date_range_pattern = re.compile(
-            r'\b(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})\s*[–—-]\s*(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})\b',
-            re.IGNORECASE
-        )
-        range_match = date_range_pattern.search(text_normalized[:3000])
+        range_match = _DATE_RANGE_RE.search(text_normalized, 0, 3000)
         if range_match:
             start_date = range_match.group(1).strip()
             end_date = range_match.group(2).strip()
     
     # Also try to find asset deadline directly from text if not found (using normalized text)
     if not asset_deadline:
-        asset_deadline_pattern = re.compile(
-            r'(?:asset\s+delivery\s+deadline|assets\s+due|deliver.*?by|deadline.*?deliver).*?(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
-            re.IGNORECASE | re.DOTALL
-        )
-        asset_match = asset_deadline_pattern.search(text_normalized[:3000])
+        asset_match = _ASSET_DEADLINE_RE.search(text_normalized, 0, 3000)
         if asset_match:
             asset_deadline = asset_match.group(1).strip()
     
@@ -70,14 +132,7 @@ def extract_simple_dates(text: str, deadlines: List[Dict[str, str]]) -> str:
     def format_date_short(date_str: str) -> str:
         if not date_str:
             return date_str
-        month_map = {
-            'January': 'Jan', 'February': 'Feb', 'March': 'Mar', 'April': 'Apr',
-            'May': 'May', 'June': 'Jun', 'July': 'Jul', 'August': 'Aug',
-            'September': 'Sep', 'October': 'Oct', 'November': 'Nov', 'December': 'Dec'
-        }
-        for full, short in month_map.items():
-            date_str = date_str.replace(full, short).replace(full.lower(), short.lower())
-        return date_str
+        return _MONTH_RE.sub(_abbreviate_month, date_str)
     
     date_parts = []
     if start_date and end_date:
@@ -93,45 +148,40 @@ def extract_simple_dates(text: str, deadlines: List[Dict[str, str]]) -> str:
     return " ".join(date_parts) + "." if date_parts else "Dates not specified."
 
 
-def extract_simple_channels(text: str) -> str:
+def extract_simple_channels(text: str, text_lower: Optional[str] = None) -> str:
     """Extract channels as single line: "Tesco website banners, Checkout ads, Instagram/Facebook Stories." """
     channels = []
-    text_lower = text.lower()
-    
-    channel_map = {
-        'Tesco website banners': ['website', 'onsite', 'site brand'],
-        'Checkout ads': ['checkout'],
-        'Instagram/Facebook Stories': ['instagram', 'facebook', 'stories'],
-        'Display ads': ['display', 'banner'],
-        'Email campaigns': ['email'],
-    }
+    if text_lower is None:
+        text_lower = text.lower()
     
-    for name, keywords in channel_map.items():
-        if any(kw in text_lower for kw in keywords):
-            channels.append(name)
-            if len(channels) >= 4:
-                break
+    if _CHANNEL_AC is not None:
+        hits = {name for _, name in _CHANNEL_AC.iter(text_lower)}
+        for name in _CHANNEL_MAP:
+            if name in hits:
+                channels.append(name)
+                if len(channels) >= 4:
+                    break
+    else:
+        for name, keywords in _CHANNEL_MAP.items():
+            if any(kw in text_lower for kw in keywords):
+                channels.append(name)
+                if len(channels) >= 4:
+                    break
     
     return ", ".join(channels) + "." if channels else "Channels not specified."
 
 
-def extract_simple_kpis(text: str, kpis: Dict[str, List[float]]) -> str:
+def extract_simple_kpis(text: str, kpis: Dict[str, List[float]], text_lower: Optional[str] = None) -> str:
     """Extract KPIs as single line: "Targets: CTR ≥ 0.40%, add-to-basket ≥ 9%, +6% sales uplift." """
     parts = []
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     
-    priority = ['CTR', 'conversion_rate', 'sales_uplift', 'add-to-basket', 'ROAS']
-    for kpi_name in priority:
+    for kpi_name in _KPI_PRIORITY:
         if kpi_name in kpis and kpis[kpi_name]:
-            value = kpis[kpi_name][0]
-            if kpi_name == 'CTR':
-                parts.append(f"CTR ≥ {value}%")
-            elif kpi_name == 'conversion_rate':
-                parts.append(f"conversion ≥ {value}%")
-            elif kpi_name == 'sales_uplift':
-                parts.append(f"+{value}% sales uplift")
-            elif kpi_name == 'add-to-basket':
-                parts.append(f"add-to-basket ≥ {value}%")
+            formatter = _SIMPLE_KPI_FORMATTERS.get(kpi_name)
+            if formatter is not None:
+                parts.append(formatter(kpis[kpi_name][0]))
             if len(parts) >= 3:
                 break
     